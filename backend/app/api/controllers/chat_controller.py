@@ -1,4 +1,5 @@
 from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import select, func, and_, text
@@ -12,28 +13,94 @@ from app.config.logging_config import get_logger
 from app.api.db.data_sources import DataSources
 from app.api.db.chat_history import (Conversations, Messages)
 from datetime import datetime
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+import time
 from app.utils.response_utils import create_response
-from app.config.llm_config import get_available_models, get_model_info, validate_model
+from app.config.llm_config import LLM, get_available_models, get_model_info, validate_model
 import json
 
 # Set up logging
 logger = get_logger(__name__)
 
-
-async def ask_question(id: int, body: AskQuestion, db: DB):
+# Data sources are never modified once uploaded, so every chat turn on a
+# dataset can reuse its row instead of selecting it again
+DATA_SOURCE_CACHE_TTL = 300
+DATA_SOURCE_CACHE_MAXSIZE = 1024
+_data_source_cache: "OrderedDict[int, tuple]" = OrderedDict()
+_data_source_cache_lock = Lock()
+
+
+def _get_data_source(db: DB, data_source_id: int) -> Optional[DataSources]:
+    """Load a data source by id, served from a short-lived in-process cache."""
+    with _data_source_cache_lock:
+        entry = _data_source_cache.get(data_source_id)
+        if entry is not None and entry[1] >= time.monotonic():
+            _data_source_cache.move_to_end(data_source_id)
+            return entry[0]
+
+    with db.session() as session:
+        data_source = session.execute(select(DataSources).where(
+            DataSources.id == data_source_id)).scalar_one_or_none()
+
+    if data_source is not None:
+        # Detached once the session closes; only its loaded columns are read
+        with _data_source_cache_lock:
+            _data_source_cache[data_source_id] = (data_source, time.monotonic() + DATA_SOURCE_CACHE_TTL)
+            _data_source_cache.move_to_end(data_source_id)
+            while len(_data_source_cache) > DATA_SOURCE_CACHE_MAXSIZE:
+                _data_source_cache.popitem(last=False)
+    return data_source
+
+
+def _data_source_preview(db: DB, data_source: DataSources) -> Optional[dict]:
+    """Sample rows of a data source, formatted as context for direct chat."""
     try:
         with db.session() as session:
-            data_source = session.execute(select(DataSources).where(
-                DataSources.id == body.dataset_id)).scalar_one_or_none()
+            # Get column names and sample rows
+            table_name = data_source.table_name
+            sample_query = text(f"SELECT * FROM {table_name} LIMIT 20")
+            result = session.execute(sample_query)
+            columns = result.keys()
+            sample_rows = result.fetchall()
+
+            # Format sample data for LLM
+            data_preview = f"**Columns:** {', '.join(columns)}\n\n"
+            data_preview += f"**Sample Data (first {len(sample_rows)} rows):**\n"
+            data_preview += "```\n"
+            # Add column headers
+            data_preview += " | ".join(columns) + "\n"
+            data_preview += "-" * (len(" | ".join(columns))) + "\n"
+            # Add sample rows
+            for row in sample_rows[:10]:  # Limit to 10 rows in preview
+                data_preview += " | ".join(str(val) if val is not None else "NULL" for val in row) + "\n"
+            data_preview += "```\n"
+
+            return {
+                "name": data_source.name,
+                "table_name": table_name,
+                "data_preview": data_preview
+            }
+    except Exception as e:
+        logger.warning(f"Could not fetch sample data: {str(e)}")
+        return None
 
-            if not data_source:
-                raise HTTPException(status_code=404, detail=create_response(
-                    status_code=404,
-                    message="Data source not found",
-                    data={}
-                ))
 
-        save_message(
+async def ask_question(id: int, body: AskQuestion, db: DB, llm: LLM):
+    try:
+        # Database calls are blocking; keep them off the event loop
+        data_source = await run_in_threadpool(_get_data_source, db, body.dataset_id)
+
+        if not data_source:
+            raise HTTPException(status_code=404, detail=create_response(
+                status_code=404,
+                message="Data source not found",
+                data={}
+            ))
+
+        question = await run_in_threadpool(
+            save_message,
             conversation_id=body.conversaction_id,
             role="user",
             content={"question": body.question},
@@ -53,42 +120,16 @@ async def ask_question(id: int, body: AskQuestion, db: DB):
             # Prepare data source info for context if available
             data_source_info = None
             if data_source:
-                # Get sample data for context
-                try:
-                    with db.session() as session:
-                        # Get column names and sample rows
-                        table_name = data_source.table_name
-                        sample_query = text(f"SELECT * FROM {table_name} LIMIT 20")
-                        result = session.execute(sample_query)
-                        columns = result.keys()
-                        sample_rows = result.fetchall()
-
-                        # Format sample data for LLM
-                        data_preview = f"**Columns:** {', '.join(columns)}\n\n"
-                        data_preview += f"**Sample Data (first {len(sample_rows)} rows):**\n"
-                        data_preview += "```\n"
-                        # Add column headers
-                        data_preview += " | ".join(columns) + "\n"
-                        data_preview += "-" * (len(" | ".join(columns))) + "\n"
-                        # Add sample rows
-                        for row in sample_rows[:10]:  # Limit to 10 rows in preview
-                            data_preview += " | ".join(str(val) if val is not None else "NULL" for val in row) + "\n"
-                        data_preview += "```\n"
-
-                        data_source_info = {
-                            "name": data_source.name,
-                            "table_name": table_name,
-                            "data_preview": data_preview
-                        }
-                except Exception as e:
-                    logger.warning(f"Could not fetch sample data: {str(e)}")
+                data_source_info = await run_in_threadpool(_data_source_preview, db, data_source)
 
             return execute_direct_chat(
                 question=body.question,
                 conversation_id=body.conversaction_id,
+                llm_instance=llm,
                 llm_model=body.llm_model,
                 system_db=db,
-                data_source_info=data_source_info
+                data_source_info=data_source_info,
+                question_id=question["id"]
             )
 
         # Otherwise, use appropriate workflow based on type
@@ -99,6 +140,7 @@ async def ask_question(id: int, body: AskQuestion, db: DB):
                 conversation_id=body.conversaction_id,
                 db_url=data_source.connection_url,
                 table_list=body.selected_tables,
+                llm_instance=llm,
                 system_db=db,
                 llm_model=body.llm_model
             )
@@ -108,6 +150,7 @@ async def ask_question(id: int, body: AskQuestion, db: DB):
                 question=body.question,
                 conversation_id=body.conversaction_id,
                 table_list=[data_source.table_name],
+                llm_instance=llm,
                 system_db=db,
                 llm_model=body.llm_model
             )
@@ -1,6 +1,7 @@
 # File: app/db/models.py
-from sqlalchemy import create_engine, MetaData, Table, Column, Integer, String, Enum, DateTime, ForeignKey, JSON, text
+from sqlalchemy import create_engine, MetaData, Table, Column, Integer, String, Enum, DateTime, ForeignKey, JSON, Index, text
 from app.config.env import DATABASE_URL
+from app.config.db_config import ENGINE_JSON_OPTIONS
 import logging
 from .chat_history import Conversations, Messages
 from .user import User
@@ -9,7 +10,7 @@ from .data_sources import DataSources
 logger = logging.getLogger(__name__)
 
 # Create the SQLAlchemy engine
-engine = create_engine(DATABASE_URL)
+engine = create_engine(DATABASE_URL, **ENGINE_JSON_OPTIONS)
 meta = MetaData()
 
 # Define tables
@@ -60,11 +61,17 @@ messages = Table(
         'CURRENT_TIMESTAMP'), onupdate=text('CURRENT_TIMESTAMP')),
 )
 
+# Chat history reads the newest messages of one conversation by id
+messages_conversation_index = Index(
+    "ix_messages_conversation_id_id", messages.c.conversation_id, messages.c.id)
+
 
 def init_db():
     try:
         # This will create both the enum type and tables
         meta.create_all(engine)
+        # create_all skips existing tables, so add the index to older databases too
+        messages_conversation_index.create(engine, checkfirst=True)
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
@@ -2,16 +2,18 @@ from fastapi import Path, APIRouter, Request, Depends
 from app.api.controllers import chat_controller
 from app.api.validators.chat_validator import AskQuestion, InitiateCinversaction
 from app.dependencies.database import get_db
+from app.dependencies.llm import get_llm
 from app.config.db_config import DB
+from app.config.llm_config import LLM
 
 # Instance of APIRouter
 chat_router = APIRouter()
 
 
 @chat_router.post("/ask-question")
-async def ask_question(request: Request, body: AskQuestion, db: DB = Depends(get_db)):
+async def ask_question(request: Request, body: AskQuestion, db: DB = Depends(get_db), llm: LLM = Depends(get_llm)):
     user_id = request.state.user_id
-    return await chat_controller.ask_question(user_id, body, db)
+    return await chat_controller.ask_question(user_id, body, db, llm)
 
 
 @chat_router.post("/initiate-conversations")
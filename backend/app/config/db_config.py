@@ -1,8 +1,7 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from sqlalchemy import create_engine, inspect, text, inspect
 from sqlalchemy.orm import sessionmaker, Session
 from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_openai import OpenAIEmbeddings
 from app.config.logging_config import get_logger
 # from langchain_community.vectorstores import PGVector
 from langchain_postgres import PGVector
@@ -11,10 +10,32 @@ from fastapi import HTTPException
 from langchain_core.documents import Document
 import pandas as pd
 from app.config.env import (DATABASE_URL)
-from typing import List, Optional
+from collections import OrderedDict
+from threading import Lock
+import time
+import orjson
 
 logger = get_logger(__name__)
 
+# (engine URL, table name) -> (column info, expiry). Table schemas only change
+# when a dataset is (re)uploaded, which invalidates its entry explicitly.
+SCHEMA_CACHE_TTL = 300
+SCHEMA_CACHE_MAXSIZE = 512
+_schema_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_schema_cache_lock = Lock()
+
+
+def _json_dumps(obj: Any) -> str:
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# create_engine() options so JSON columns (e.g. saved chat messages) are
+# (de)serialized with orjson; shared by every engine the app creates
+ENGINE_JSON_OPTIONS: Dict[str, Any] = {
+    "json_serializer": _json_dumps,
+    "json_deserializer": orjson.loads,
+}
+
 
 class DB:
     def __init__(self, db_url: str):
@@ -24,7 +45,7 @@ class DB:
         Args:
             db_url (str): Database URL
         """
-        self.engine = create_engine(db_url)
+        self.engine = create_engine(db_url, **ENGINE_JSON_OPTIONS)
         self.session = sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine)
         self.inspector = inspect(self.engine)
@@ -47,30 +68,32 @@ class DB:
 
     def get_schemas(self, table_names: List[str]) -> List[Dict]:
         try:
-            # Create an inspector object
-            inspector = inspect(self.engine)
+            # Create the inspector only if a table isn't cached
+            inspector = None
 
             # Initialize an array to hold the schema information for all tables
             schemas_info = []
 
             for table_name in table_names:
-                schema_info = {
-                    "table_name": table_name,
-                    "schema": []
-                }
-
-                # Get the columns for the specified table
-                columns = inspector.get_columns(table_name)
-                # Collect column information
-                for column in columns:
-                    schema_info["schema"].append({
+                columns_info = self._cached_columns(table_name)
+                if columns_info is None:
+                    if inspector is None:
+                        inspector = inspect(self.engine)
+                    # Get the columns for the specified table
+                    columns = inspector.get_columns(table_name)
+                    # Collect column information
+                    columns_info = [{
                         "name": column['name'],
                         "type": str(column['type']),
                         "nullable": column['nullable']
-                    })
+                    } for column in columns]
+                    self._cache_columns(table_name, columns_info)
 
                 # Append the schema information for the current table to the list
-                schemas_info.append(schema_info)
+                schemas_info.append({
+                    "table_name": table_name,
+                    "schema": list(columns_info)
+                })
 
             # Return the schema information for all tables
             return schemas_info
@@ -79,6 +102,29 @@ class DB:
             logger.error(f"An error occurred: {e}")
             return []  # Return an empty list in case of an error
 
+    def _cached_columns(self, table_name: str) -> Optional[List[Dict]]:
+        key = (self.engine.url, table_name)
+        with _schema_cache_lock:
+            entry = _schema_cache.get(key)
+            if entry is None:
+                return None
+            if entry[1] < time.monotonic():
+                del _schema_cache[key]
+                return None
+            _schema_cache.move_to_end(key)
+            return entry[0]
+
+    def _cache_columns(self, table_name: str, columns_info: List[Dict]) -> None:
+        with _schema_cache_lock:
+            _schema_cache[(self.engine.url, table_name)] = (columns_info, time.monotonic() + SCHEMA_CACHE_TTL)
+            while len(_schema_cache) > SCHEMA_CACHE_MAXSIZE:
+                _schema_cache.popitem(last=False)
+
+    def invalidate_schema(self, table_name: str) -> None:
+        """Drop the cached schema of a table after its structure changed."""
+        with _schema_cache_lock:
+            _schema_cache.pop((self.engine.url, table_name), None)
+
     async def insert_dataframe(self, df: pd.DataFrame, table_name: str) -> Dict[str, Any]:
         """Insert pandas DataFrame into database"""
         try:
@@ -89,6 +135,8 @@ class DB:
                     if_exists='replace',
                     index=False
                 )
+                # The table was replaced, so its columns may have changed
+                self.invalidate_schema(table_name)
                 return {
                     "message": f"Successfully inserted data into table {table_name}",
                     "rows_processed": len(df)
@@ -103,13 +151,14 @@ class VectorDB:
     def __init__(self):
         """Initialize VectorDB with connection string"""
         self.connection_string = DATABASE_URL
-        self._embedding: Optional[OpenAIEmbeddings] = None
+        self._embedding = None
 
     def initialize_embedding(self, model_name: str = "text-embedding-3-large"):
         """
         Initialize the embedding model.
         """
         if self._embedding is None:
+            from langchain_openai import OpenAIEmbeddings
             self._embedding = OpenAIEmbeddings(model=model_name)
             return "Embedding model initialized successfully."
         return "Embedding model already initialized."
@@ -12,24 +12,30 @@ Key Features:
 - Easy model selection for different use cases
 """
 
-from typing import Optional, Dict, List, Any
-from dataclasses import dataclass
+from typing import Optional, Dict, List, Any, AsyncIterator, Callable, Literal, Mapping, Tuple
+from types import MappingProxyType
+from dataclasses import dataclass, field
 from enum import Enum
-from langchain_groq import ChatGroq
-from langchain_openai import ChatOpenAI
-from langchain_ollama.llms import OllamaLLM
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+import httpx
 from langchain_core.language_models import BaseLLM
 from app.config.env import (GROQ_API_KEY, OPENAI_API_KEY)
 from app.config.logging_config import get_logger
+from app.utils.llm_utils import LoopLocalTransport, ResponseCache, response_cache, model_id
 
 logger = get_logger(__name__)
 
 
-class ModelPlatform(Enum):
-    """Supported LLM platforms"""
-    OPENAI = "openai"
-    GROQ = "groq"
-    OLLAMA = "ollama"
+# Supported LLM platforms. Plain (interned) strings keep platform dispatch to a
+# single dict lookup instead of Enum construction and comparison.
+ModelPlatform = Literal["openai", "groq", "ollama"]
+
+PLATFORM_OPENAI: ModelPlatform = "openai"
+PLATFORM_GROQ: ModelPlatform = "groq"
+PLATFORM_OLLAMA: ModelPlatform = "ollama"
+PLATFORMS: Tuple[str, ...] = (PLATFORM_OPENAI, PLATFORM_GROQ, PLATFORM_OLLAMA)
 
 
 class ModelCapability(Enum):
@@ -40,9 +46,9 @@ class ModelCapability(Enum):
     BALANCED = "balanced"   # Balance of speed and capability
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelConfig:
-    """Configuration for a single LLM model"""
+    """Configuration for a single LLM model (immutable and hashable)"""
     name: str
     platform: ModelPlatform
     display_name: str
@@ -50,97 +56,93 @@ class ModelConfig:
     capability: ModelCapability
     temperature: float = 0.0
     max_tokens: Optional[int] = None
-    best_for: List[str] = None
-
-    def __post_init__(self):
-        if self.best_for is None:
-            self.best_for = []
+    best_for: Tuple[str, ...] = field(default_factory=tuple)
 
 
 # ============================================================================
 # MODEL DEFINITIONS
 # ============================================================================
 
-AVAILABLE_MODELS: Dict[str, ModelConfig] = {
+_AVAILABLE_MODELS: Dict[str, ModelConfig] = {
     # OpenAI Models
     "o1": ModelConfig(
         name="o1",
-        platform=ModelPlatform.OPENAI,
+        platform=PLATFORM_OPENAI,
         display_name="OpenAI o1",
         description="Most advanced reasoning model for complex problem-solving",
         capability=ModelCapability.REASONING,
         temperature=1.0,  # o1 models require temperature=1
-        best_for=["Complex SQL queries", "Advanced data analysis", "Multi-step reasoning"]
+        best_for=("Complex SQL queries", "Advanced data analysis", "Multi-step reasoning")
     ),
     "o1-mini": ModelConfig(
         name="o1-mini",
-        platform=ModelPlatform.OPENAI,
+        platform=PLATFORM_OPENAI,
         display_name="OpenAI o1-mini",
         description="Fast reasoning model optimized for STEM tasks",
         capability=ModelCapability.REASONING,
         temperature=1.0,  # o1 models require temperature=1
-        best_for=["SQL query generation", "Data validation", "Quick analysis"]
+        best_for=("SQL query generation", "Data validation", "Quick analysis")
     ),
     "gpt-4o": ModelConfig(
         name="gpt-4o",
-        platform=ModelPlatform.OPENAI,
+        platform=PLATFORM_OPENAI,
         display_name="GPT-4o",
         description="Current flagship model with high intelligence and multimodal capabilities",
         capability=ModelCapability.GENERAL,
         temperature=0.0,
-        best_for=["Data analysis", "Complex queries", "Report generation"]
+        best_for=("Data analysis", "Complex queries", "Report generation")
     ),
     "gpt-4o-mini": ModelConfig(
         name="gpt-4o-mini",
-        platform=ModelPlatform.OPENAI,
+        platform=PLATFORM_OPENAI,
         display_name="GPT-4o Mini",
         description="Fast and cost-effective model for everyday tasks",
         capability=ModelCapability.FAST,
         temperature=0.0,
-        best_for=["Chat responses", "Formatting results", "Quick queries"]
+        best_for=("Chat responses", "Formatting results", "Quick queries")
     ),
     "gpt-3.5-turbo": ModelConfig(
         name="gpt-3.5-turbo",
-        platform=ModelPlatform.OPENAI,
+        platform=PLATFORM_OPENAI,
         display_name="GPT-3.5 Turbo",
         description="Legacy model, fast and cost-effective",
         capability=ModelCapability.FAST,
         temperature=0.0,
-        best_for=["Simple queries", "Basic formatting"]
+        best_for=("Simple queries", "Basic formatting")
     ),
 
     # Groq Models (Fixed model names)
     "llama-3.1-8b-instant": ModelConfig(
         name="llama-3.1-8b-instant",
-        platform=ModelPlatform.GROQ,
+        platform=PLATFORM_GROQ,
         display_name="Llama 3.1 8B",
         description="Fast and efficient open-source model",
         capability=ModelCapability.FAST,
         temperature=0.0,
-        best_for=["Quick responses", "Simple queries", "Fallback option"]
+        best_for=("Quick responses", "Simple queries", "Fallback option")
     ),
     "gemma2-9b-it": ModelConfig(
         name="gemma2-9b-it",
-        platform=ModelPlatform.GROQ,
+        platform=PLATFORM_GROQ,
         display_name="Gemma 2 9B",
         description="Google's efficient instruction-tuned model",
         capability=ModelCapability.BALANCED,
         temperature=0.0,
-        best_for=["General queries", "Data formatting", "Visualization recommendations"]
+        best_for=("General queries", "Data formatting", "Visualization recommendations")
     ),
     "mixtral-8x7b-32768": ModelConfig(
         name="mixtral-8x7b-32768",
-        platform=ModelPlatform.GROQ,
+        platform=PLATFORM_GROQ,
         display_name="Mixtral 8x7B",
         description="High-capability mixture-of-experts model",
         capability=ModelCapability.GENERAL,
         temperature=0.0,
-        best_for=["Complex analysis", "Long context tasks"]
+        best_for=("Complex analysis", "Long context tasks")
     ),
 }
 
 # Default models for different use cases
-DEFAULT_MODELS = {
+_DEFAULT_MODELS: Dict[str, str] = {
     "sql_generation": "o1-mini",      # Best for generating SQL queries
     "data_analysis": "gpt-4o",         # Best for analyzing data
     "chat": "gpt-4o-mini",             # Best for chat/formatting
@@ -148,6 +150,147 @@ DEFAULT_MODELS = {
     "fallback": "llama-3.1-8b-instant" # Fallback when OpenAI fails
 }
 
+# Read-only views: the model configuration is immutable and can be shared
+# across threads and forked workers without defensive copies.
+AVAILABLE_MODELS: Mapping[str, ModelConfig] = MappingProxyType(_AVAILABLE_MODELS)
+DEFAULT_MODELS: Mapping[str, str] = MappingProxyType(_DEFAULT_MODELS)
+
+# OpenAI models that accept a strict json_schema response_format; others
+# (o1, o1-mini, gpt-3.5-turbo) reject it and follow the prompt's JSON instructions
+STRUCTURED_OUTPUT_MODEL_PREFIXES = ("gpt-4o",)
+
+
+# ============================================================================
+# CLIENT FACTORY
+# ============================================================================
+
+# Long-lived HTTP client shared by every OpenAI/Groq client so TCP+TLS
+# handshakes are paid once per process instead of once per request.
+_HTTP_CLIENT = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=64)
+)
+# Async connections are bound to an event loop, so the pool is kept per loop
+_HTTP_ASYNC_CLIENT = httpx.AsyncClient(
+    transport=LoopLocalTransport(lambda: httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=64)
+    ))
+)
+
+# Responses are only cached for (near-)deterministic clients
+CACHEABLE_TEMPERATURE = 0.3
+
+# OpenAI prompt-cache routing key shared by all requests from this service
+PROMPT_CACHE_KEY = "ai-data-analyst"
+
+# Provider SDKs are imported on first use so a worker only pays the import
+# time and memory for the platforms it actually talks to.
+_ChatGroq = None
+_ChatOpenAI = None
+_OllamaLLM = None
+
+
+def _get_ChatGroq():
+    global _ChatGroq
+    if _ChatGroq is None:
+        from langchain_groq import ChatGroq as _ChatGroq_
+        _ChatGroq = _ChatGroq_
+    return _ChatGroq
+
+
+def _get_ChatOpenAI():
+    global _ChatOpenAI
+    if _ChatOpenAI is None:
+        from langchain_openai import ChatOpenAI as _ChatOpenAI_
+        _ChatOpenAI = _ChatOpenAI_
+    return _ChatOpenAI
+
+
+def _get_OllamaLLM():
+    global _OllamaLLM
+    if _OllamaLLM is None:
+        from langchain_ollama.llms import OllamaLLM as _OllamaLLM_
+        _OllamaLLM = _OllamaLLM_
+    return _OllamaLLM
+
+
+@lru_cache(maxsize=32)
+def _build_client(platform: str, model: str, temperature: Optional[float] = None) -> BaseLLM:
+    """
+    Build a LangChain client, reusing it for repeated (platform, model, temperature) keys.
+
+    Args:
+        platform: Platform value (e.g., "openai", "groq", "ollama")
+        model: Model name
+        temperature: Sampling temperature (ignored for Ollama)
+
+    Returns:
+        Cached LLM client instance
+    """
+    cache = response_cache if temperature is not None and temperature <= CACHEABLE_TEMPERATURE else None
+    if platform == PLATFORM_GROQ:
+        return _get_ChatGroq()(
+            groq_api_key=GROQ_API_KEY,
+            model=model,
+            temperature=temperature,
+            http_client=_HTTP_CLIENT,
+            http_async_client=_HTTP_ASYNC_CLIENT,
+            cache=cache
+        )
+    if platform == PLATFORM_OPENAI:
+        return _get_ChatOpenAI()(
+            api_key=OPENAI_API_KEY,
+            model=model,
+            temperature=temperature,
+            http_client=_HTTP_CLIENT,
+            http_async_client=_HTTP_ASYNC_CLIENT,
+            # Route requests sharing our static system prompts to the same
+            # prompt-cache shard
+            extra_body={"prompt_cache_key": PROMPT_CACHE_KEY},
+            cache=cache
+        )
+    if platform == PLATFORM_OLLAMA:
+        return _get_OllamaLLM()(model=model)
+    raise ValueError(f"Unknown platform: {platform}")
+
+
+async def close_http_clients() -> None:
+    """Close the shared provider connection pools; call once at app shutdown."""
+    _HTTP_CLIENT.close()
+    await _HTTP_ASYNC_CLIENT.aclose()
+
+
+# (model name, fallback) -> client, for names that resolved to the requested model
+_RESOLVED_MODELS_MAXSIZE = 32
+_resolved_models: "OrderedDict[Tuple[str, bool], BaseLLM]" = OrderedDict()
+_resolved_models_lock = Lock()
+
+
+def _resolve_model(llm: "LLM", model_name: str, fallback: bool) -> BaseLLM:
+    """
+    Memoize LLM.get_model per requested name.
+
+    Clients are shared and thread-safe, so the lookup and the client
+    construction only run on the first request for a name. Failures and
+    fallback substitutions aren't cached, so the requested model is retried
+    on the next call.
+    """
+    key = (model_name, fallback)
+    with _resolved_models_lock:
+        model = _resolved_models.get(key)
+        if model is not None:
+            _resolved_models.move_to_end(key)
+            return model
+
+    model = llm._load_model(model_name, fallback)
+    if model_id(model) == model_name:
+        with _resolved_models_lock:
+            _resolved_models[key] = model
+            while len(_resolved_models) > _RESOLVED_MODELS_MAXSIZE:
+                _resolved_models.popitem(last=False)
+    return model
+
 
 # ============================================================================
 # LLM CLASS
@@ -155,7 +298,10 @@ DEFAULT_MODELS = {
 
 class LLM:
     """
-    Main LLM class for creating and managing language model instances.
+    Stateless router for resolving language model instances.
+
+    Holds no per-request state, so a single instance can be shared by every
+    request (see app.dependencies.llm).
 
     Usage:
         llm = LLM()
@@ -163,11 +309,6 @@ class LLM:
         model = llm.get_model_for_task("sql_generation")  # Get optimal model for task
     """
 
-    def __init__(self):
-        self.llm: Optional[BaseLLM] = None
-        self.platform: Optional[str] = None
-        self.current_model: Optional[str] = None
-
     def groq(self, model: str, temperature: Optional[float] = None) -> BaseLLM:
         """
         Create a Groq LLM instance.
@@ -185,15 +326,9 @@ class LLM:
         config = AVAILABLE_MODELS.get(model)
         temp = temperature if temperature is not None else (config.temperature if config else 0.0)
 
-        self.llm = ChatGroq(
-            groq_api_key=GROQ_API_KEY,
-            model=model,
-            temperature=temp
-        )
-        self.platform = "Groq"
-        self.current_model = model
-        logger.info(f"Initialized Groq model: {model} with temperature: {temp}")
-        return self.llm
+        llm = _build_client(PLATFORM_GROQ, model, temp)
+        logger.info("Initialized Groq model: %s with temperature: %s", model, temp)
+        return llm
 
     def openai(self, model: str, temperature: Optional[float] = None) -> BaseLLM:
         """
@@ -216,31 +351,24 @@ class LLM:
         if model in ["o1", "o1-mini"] and temperature is None:
             temp = 1.0
 
-        self.llm = ChatOpenAI(
-            api_key=OPENAI_API_KEY,
-            model=model,
-            temperature=temp
-        )
-        self.platform = "OpenAI"
-        self.current_model = model
-        logger.info(f"Initialized OpenAI model: {model} with temperature: {temp}")
-        return self.llm
+        llm = _build_client(PLATFORM_OPENAI, model, temp)
+        logger.info("Initialized OpenAI model: %s with temperature: %s", model, temp)
+        return llm
 
-    def ollama(self, model: str) -> BaseLLM:
+    def ollama(self, model: str, temperature: Optional[float] = None) -> BaseLLM:
         """
         Create an Ollama LLM instance.
 
         Args:
             model: Model name
+            temperature: Accepted for a uniform constructor signature; unused
 
         Returns:
             OllamaLLM instance
         """
-        self.llm = OllamaLLM(model=model)
-        self.platform = "Ollama"
-        self.current_model = model
-        logger.info(f"Initialized Ollama model: {model}")
-        return self.llm
+        llm = _build_client(PLATFORM_OLLAMA, model)
+        logger.info("Initialized Ollama model: %s", model)
+        return llm
 
     def get_model(self, model_name: str, fallback: bool = True) -> BaseLLM:
         """
@@ -256,10 +384,13 @@ class LLM:
         Raises:
             ValueError: If model not found and fallback is False
         """
+        return _resolve_model(self, model_name, fallback)
+
+    def _load_model(self, model_name: str, fallback: bool) -> BaseLLM:
         if model_name not in AVAILABLE_MODELS:
-            logger.warning(f"Model '{model_name}' not found in available models")
+            logger.warning("Model '%s' not found in available models", model_name)
             if fallback:
-                logger.info(f"Falling back to default model: {DEFAULT_MODELS['fallback']}")
+                logger.info("Falling back to default model: %s", DEFAULT_MODELS['fallback'])
                 model_name = DEFAULT_MODELS['fallback']
             else:
                 raise ValueError(f"Model '{model_name}' not found. Available models: {list(AVAILABLE_MODELS.keys())}")
@@ -267,18 +398,14 @@ class LLM:
         config = AVAILABLE_MODELS[model_name]
 
         try:
-            if config.platform == ModelPlatform.OPENAI:
-                return self.openai(model_name)
-            elif config.platform == ModelPlatform.GROQ:
-                return self.groq(model_name)
-            elif config.platform == ModelPlatform.OLLAMA:
-                return self.ollama(model_name)
-            else:
+            ctor = _PLATFORM_CTOR.get(config.platform)
+            if ctor is None:
                 raise ValueError(f"Unknown platform: {config.platform}")
+            return ctor(self, model_name)
         except Exception as e:
-            logger.error(f"Error initializing model {model_name}: {str(e)}")
+            logger.error("Error initializing model %s: %s", model_name, e)
             if fallback and model_name != DEFAULT_MODELS['fallback']:
-                logger.info(f"Falling back to: {DEFAULT_MODELS['fallback']}")
+                logger.info("Falling back to: %s", DEFAULT_MODELS['fallback'])
                 return self.get_model(DEFAULT_MODELS['fallback'], fallback=False)
             raise
 
@@ -292,27 +419,142 @@ class LLM:
         Returns:
             LLM instance optimized for the task
         """
-        model_name = DEFAULT_MODELS.get(task, DEFAULT_MODELS['chat'])
-        logger.info(f"Getting model for task '{task}': {model_name}")
-        return self.get_model(model_name)
-
-    def get_llm(self) -> Optional[BaseLLM]:
-        """Get the current LLM instance."""
-        return self.llm
+        ctor, model_name, temperature = _TASK_DISPATCH.get(task) or _TASK_DISPATCH['chat']
+        logger.info("Getting model for task '%s': %s", task, model_name)
+        try:
+            return ctor(self, model_name, temperature)
+        except Exception as e:
+            logger.error("Error initializing model %s: %s", model_name, e)
+            if model_name != DEFAULT_MODELS['fallback']:
+                logger.info("Falling back to: %s", DEFAULT_MODELS['fallback'])
+                return self.get_model(DEFAULT_MODELS['fallback'], fallback=False)
+            raise
 
-    def invoke(self, prompt: str) -> str:
+    def invoke(self, prompt: str, model_name: Optional[str] = None) -> str:
         """
-        Invoke the current LLM with a prompt.
+        Invoke a model with a prompt. Low-temperature clients serve repeated
+        prompts from the response cache they are built with.
 
         Args:
             prompt: The prompt to send to the LLM
+            model_name: Model to use (defaults to the "chat" task model)
 
         Returns:
             The LLM's response
         """
-        if not self.llm:
-            raise ValueError("No LLM initialized. Call get_model() first.")
-        return self.llm.invoke(prompt)
+        llm = self.get_model(model_name) if model_name else self.get_model_for_task("chat")
+        return llm.invoke(prompt)
+
+    async def astream(self, prompt: Any, model_name: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Stream a model's response as text chunks as soon as they are generated.
+
+        LangChain doesn't consult a client's cache when streaming, so this looks
+        up the response cache itself: a cached response is yielded as a single
+        chunk, otherwise the streamed chunks are concatenated and cached once
+        the stream completes.
+
+        Args:
+            prompt: The prompt (or list of messages) to send to the LLM
+            model_name: Model to use (defaults to the "chat" task model)
+
+        Yields:
+            Text chunks of the response
+        """
+        llm = self.get_model(model_name) if model_name else self.get_model_for_task("chat")
+        key = _cache_key(llm, prompt)
+        response = response_cache.get(key) if _is_cached(llm) else None
+        if response is not None:
+            yield getattr(response, 'content', response)
+            return
+
+        full = None
+        async for chunk in llm.astream(prompt):
+            full = chunk if full is None else full + chunk
+            yield getattr(chunk, 'content', chunk)
+        if full is not None and _is_cached(llm):
+            response_cache.set(key, full)
+
+
+def _cache_key(llm: BaseLLM, prompt: Any) -> str:
+    # The client's parameters (model, temperature, extra_body, ...) are part of the key.
+    # Namespaced so streamed messages never collide with the generations
+    # LangChain caches for the same prompt in the same store.
+    return ResponseCache.make_key(f"astream\x00{llm._get_llm_string()}", prompt)
+
+
+def _is_cached(llm: BaseLLM) -> bool:
+    """Whether responses of this client may be served from the response cache."""
+    return getattr(llm, 'cache', None) is response_cache
+
+
+def _is_openai_client(llm: BaseLLM) -> bool:
+    # Look through bind() wrappers so per-prompt bindings can be stacked
+    return _ChatOpenAI is not None and isinstance(getattr(llm, "bound", llm), _ChatOpenAI)
+
+
+def _supports_structured_output(llm: BaseLLM) -> bool:
+    return model_id(getattr(llm, "bound", llm)).startswith(STRUCTURED_OUTPUT_MODEL_PREFIXES)
+
+
+def with_prompt_cache_key(llm: BaseLLM, key: str) -> BaseLLM:
+    """
+    Bind an OpenAI prompt_cache_key for a specific prompt.
+
+    Requests sharing a key are routed to the same prompt-cache shard. Clients
+    of other platforms are returned unchanged.
+
+    Args:
+        llm: LangChain client
+        key: Cache key, e.g. from analyst_prompts.prompt_cache_key
+
+    Returns:
+        The client with the key bound, or the client itself
+    """
+    if _is_openai_client(llm):
+        return llm.bind(extra_body={"prompt_cache_key": key})
+    return llm
+
+
+def with_json_schema(llm: BaseLLM, name: str, schema: Dict[str, Any]) -> BaseLLM:
+    """
+    Bind an OpenAI structured-output response format to a client.
+
+    The model is then constrained to return JSON matching `schema`, so the
+    reply always parses. Clients of other platforms, and OpenAI models
+    without structured-output support (see STRUCTURED_OUTPUT_MODEL_PREFIXES),
+    are returned unchanged and rely on the prompt's JSON instructions.
+
+    Args:
+        llm: LangChain client
+        name: Name of the response schema
+        schema: Strict JSON schema of the response
+
+    Returns:
+        The client with the response format bound, or the client itself
+    """
+    if _is_openai_client(llm) and _supports_structured_output(llm):
+        return llm.bind(response_format={
+            "type": "json_schema",
+            "json_schema": {"name": name, "strict": True, "schema": schema},
+        })
+    return llm
+
+
+# Platform -> LLM constructor, resolved once at import time
+_PLATFORM_CTOR: Dict[str, Callable[..., BaseLLM]] = {
+    PLATFORM_OPENAI: LLM.openai,
+    PLATFORM_GROQ: LLM.groq,
+    PLATFORM_OLLAMA: LLM.ollama,
+}
+
+# Task -> (constructor, model name, temperature) so task lookups skip the
+# AVAILABLE_MODELS/platform resolution on every request
+_TASK_DISPATCH: Dict[str, Tuple[Callable[..., BaseLLM], str, float]] = {
+    task: (_PLATFORM_CTOR[config.platform], model_name, config.temperature)
+    for task, model_name in DEFAULT_MODELS.items()
+    for config in [AVAILABLE_MODELS[model_name]]
+}
 
 
 # ============================================================================
@@ -324,20 +566,10 @@ def get_available_models() -> List[Dict[str, Any]]:
     Get a list of all available models with their metadata.
 
     Returns:
-        List of model information dictionaries
+        List of model information dictionaries. The list is a fresh copy but
+        the dictionaries are shared and must not be mutated.
     """
-    models = []
-    for name, config in AVAILABLE_MODELS.items():
-        models.append({
-            "name": name,
-            "display_name": config.display_name,
-            "description": config.description,
-            "platform": config.platform.value,
-            "capability": config.capability.value,
-            "best_for": config.best_for,
-            "temperature": config.temperature
-        })
-    return models
+    return list(_AVAILABLE_MODELS_LIST)
 
 
 def get_models_by_platform(platform: str) -> List[str]:
@@ -350,15 +582,11 @@ def get_models_by_platform(platform: str) -> List[str]:
     Returns:
         List of model names
     """
-    try:
-        platform_enum = ModelPlatform(platform.lower())
-        return [
-            name for name, config in AVAILABLE_MODELS.items()
-            if config.platform == platform_enum
-        ]
-    except ValueError:
-        logger.error(f"Invalid platform: {platform}")
+    models = _MODELS_BY_PLATFORM.get(platform.lower())
+    if models is None:
+        logger.error("Invalid platform: %s", platform)
         return []
+    return list(models)
 
 
 def get_models_by_capability(capability: str) -> List[str]:
@@ -372,13 +600,9 @@ def get_models_by_capability(capability: str) -> List[str]:
         List of model names
     """
     try:
-        capability_enum = ModelCapability(capability.lower())
-        return [
-            name for name, config in AVAILABLE_MODELS.items()
-            if config.capability == capability_enum
-        ]
+        return list(_MODELS_BY_CAPABILITY[ModelCapability(capability.lower())])
     except ValueError:
-        logger.error(f"Invalid capability: {capability}")
+        logger.error("Invalid capability: %s", capability)
         return []
 
 
@@ -413,8 +637,37 @@ def get_model_info(model_name: str) -> Optional[Dict[str, Any]]:
         "name": config.name,
         "display_name": config.display_name,
         "description": config.description,
-        "platform": config.platform.value,
+        "platform": config.platform,
         "capability": config.capability.value,
         "temperature": config.temperature,
-        "best_for": config.best_for
-    }
\ No newline at end of file
+        "best_for": list(config.best_for)
+    }
+
+
+# ============================================================================
+# PRECOMPUTED LOOKUPS
+# ============================================================================
+
+# Model listings are pure functions of the definitions above, so build them once
+_AVAILABLE_MODELS_LIST: Tuple[Dict[str, Any], ...] = tuple(
+    {
+        "name": name,
+        "display_name": config.display_name,
+        "description": config.description,
+        "platform": config.platform,
+        "capability": config.capability.value,
+        "best_for": list(config.best_for),
+        "temperature": config.temperature
+    }
+    for name, config in AVAILABLE_MODELS.items()
+)
+
+_MODELS_BY_PLATFORM: Dict[str, Tuple[str, ...]] = {
+    platform: tuple(name for name, config in AVAILABLE_MODELS.items() if config.platform == platform)
+    for platform in PLATFORMS
+}
+
+_MODELS_BY_CAPABILITY: Dict[ModelCapability, Tuple[str, ...]] = {
+    capability: tuple(name for name, config in AVAILABLE_MODELS.items() if config.capability == capability)
+    for capability in ModelCapability
+}
\ No newline at end of file
@@ -0,0 +1,7 @@
+from app.config.llm_config import LLM
+
+llm = LLM()
+
+
+def get_llm() -> LLM:
+    return llm
@@ -5,13 +5,20 @@ from langchain_core.output_parsers import JsonOutputParser, StrOutputParser
 from langchain_core.language_models import BaseLLM
 from app.langgraph.prompt_templates.analyst_prompts import (
     get_schema_insights_prompt,
-    generate_sql_query_prompt,
-    fix_sql_query_prompt,
-    format_results_prompt,
+    get_generate_sql_query_prompt,
+    get_fix_sql_query_prompt,
+    get_format_results_prompt,
     get_visualization_prompt,
-    conversational_prompt
+    get_conversational_prompt,
+    get_unified_sql_prompt,
+    UNIFIED_SQL_SCHEMA,
+    detect_sql_query_types,
+    prompt_cache_key
 )
 from app.langgraph.prompt_templates.graph_prompts import get_prompt
+from app.utils.sql_utils import (add_missing_value_filters, filter_schema, is_valid_sql,
+                                 match_schema_insights, relevant_table_names)
+from app.config.llm_config import with_json_schema, with_prompt_cache_key
 from app.config.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -23,7 +30,7 @@ class SQLAgent:
         self.json_parser = JsonOutputParser()
         self.llm = llm
 
-    def get_parse_question(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def get_parse_question(self, state: Dict[str, Any]) -> Dict[str, Any]:
         logger.info("======= get_parse_question =======")
         # Check for required keys in the state
         required_keys = ["schema", "question"]
@@ -35,15 +42,19 @@ class SQLAgent:
 
         question = state['question']
         schema = state['schema']
+        # Questions that name their tables don't need the LLM to find them
+        parsed_question = match_schema_insights(question, schema)
+        if parsed_question is not None:
+            return {"parsed_question": parsed_question}
         # Ensure chain components are properly initialized
         if not self.llm or not self.json_parser:
             raise ValueError("LLM or JSON Parser is not initialized.")
         # Execute the chain
-        chain = get_schema_insights_prompt | self.llm | self.json_parser
-        response = chain.invoke({"schema": schema, "question": question})
+        chain = get_schema_insights_prompt() | self.llm | self.json_parser
+        response = await chain.ainvoke({"schema": schema, "question": question})
         return {"parsed_question": response}
 
-    def generate_sql_query(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def generate_sql_query(self, state: Dict[str, Any]) -> Dict[str, Any]:
         logger.info("======= generate_sql_query =======")
         # Check for required keys in the state
         required_keys = ["schema", "question", "parsed_question"]
@@ -53,23 +64,26 @@ class SQLAgent:
             raise ValueError(
                 f"Missing required keys in state: {', '.join(missing_keys)}")
 
-        schema = state["schema"]
         question = state["question"]
         parsed_question = state["parsed_question"]
+        # Only send the tables the schema-insights step flagged as relevant
+        schema = filter_schema(state["schema"], relevant_table_names(parsed_question))
         # Ensure chain components are properly initialized
         if not self.llm or not self.str_parser:
             raise ValueError("LLM or String Parser is not initialized.")
 
-        chain = generate_sql_query_prompt | self.llm | self.str_parser
-        response = chain.invoke(
-            {"schema": schema, "question": question, "relevant_table_column": parsed_question})
+        llm = with_prompt_cache_key(self.llm, prompt_cache_key("generate_sql"))
+        chain = get_generate_sql_query_prompt() | llm | self.str_parser
+        response = await chain.ainvoke(
+            {"schema": schema, "question": question, "relevant_table_column": parsed_question,
+             "query_types": detect_sql_query_types(question, parsed_question)})
         clean_sql_query = response.strip('`').replace('sql\n', '', 1).strip()
         if response.strip() == "NOT_ENOUGH_INFO":
             return {"sql_query": "NOT_RELEVANT"}
         else:
-            return {"sql_query": clean_sql_query}
+            return {"sql_query": add_missing_value_filters(clean_sql_query, schema)}
 
-    def validate_and_fix_sql(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def validate_and_fix_sql(self, state: Dict[str, Any]) -> Dict[str, Any]:
         logger.info("========= validate_and_fix_sql ========")
         required_keys = ["schema", "sql_query"]
         missing_keys = [key for key in required_keys if key not in state]
@@ -79,14 +93,18 @@ class SQLAgent:
                 f"Missing required keys in state: {', '.join(missing_keys)}")
 
         sql_query = state['sql_query']
-        schema = state['schema']
+        schema = filter_schema(state['schema'], relevant_table_names(state.get('parsed_question')))
+
+        # Skip the LLM round trip when the query parses and matches the schema
+        if is_valid_sql(sql_query, schema):
+            return {"sql_query": sql_query, "sql_valid": True}
 
         # Ensure chain components are properly initialized
         if not self.llm or not self.json_parser:
             raise ValueError("LLM or JSON Parser is not initialized.")
 
-        chain = fix_sql_query_prompt | self.llm | self.json_parser
-        response = chain.invoke({"schema": schema, "sql_query": sql_query})
+        chain = get_fix_sql_query_prompt() | self.llm | self.json_parser
+        response = await chain.ainvoke({"schema": schema, "sql_query": sql_query})
 
         if response["valid"] and response["issues"] is None:
             return {"sql_query": sql_query, "sql_valid": True}
@@ -97,7 +115,62 @@ class SQLAgent:
                 "sql_issues": response["issues"]
             }
 
-    def format_results(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def unified_sql(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Schema insights, SQL generation and validation in a single LLM call.
+
+        Returns the same state keys as get_parse_question, generate_sql_query
+        and validate_and_fix_sql combined. For questions that aren't about the
+        data it returns the conversational reply instead of a query.
+        """
+        logger.info("========= unified_sql ========")
+        required_keys = ["schema", "question"]
+        missing_keys = [key for key in required_keys if key not in state]
+
+        if missing_keys:
+            raise ValueError(
+                f"Missing required keys in state: {', '.join(missing_keys)}")
+
+        question = state['question']
+        schema = state['schema']
+        # The LLM picks the relevant tables itself, so it sees the full schema
+        matched = match_schema_insights(question, schema)
+
+        if not self.llm or not self.json_parser:
+            raise ValueError("LLM or JSON Parser is not initialized.")
+
+        llm = with_prompt_cache_key(self.llm, prompt_cache_key("unified_sql"))
+        llm = with_json_schema(llm, "unified_sql", UNIFIED_SQL_SCHEMA)
+        chain = get_unified_sql_prompt() | llm | self.json_parser
+        response = await chain.ainvoke(
+            {"schema": schema, "question": question,
+             "query_types": detect_sql_query_types(question, matched)})
+
+        parsed_question = {
+            "is_relevant": response.get("is_relevant", True),
+            "relevant_tables": response.get("relevant_tables") or [],
+        }
+        if not parsed_question["is_relevant"]:
+            # Answered in this same call; conversational_response just relays it
+            return {"parsed_question": parsed_question, "conversational_reply": response.get("reply")}
+
+        sql_query = (response.get("sql_query") or "").strip()
+        if sql_query.startswith("```"):
+            sql_query = sql_query.strip('`').replace('sql\n', '', 1).strip()
+        validation = response.get("validation") or {}
+        if not sql_query or sql_query == "NOT_ENOUGH_INFO":
+            return {"parsed_question": parsed_question, "sql_query": "NOT_RELEVANT",
+                    "sql_valid": False, "sql_issues": validation.get("issues")}
+
+        sql_query = add_missing_value_filters(
+            sql_query, filter_schema(schema, relevant_table_names(parsed_question)))
+        # The model's own verdict isn't trusted: queries that don't check out
+        # locally go through the regular fix step
+        fixed = await self.validate_and_fix_sql(
+            {"schema": schema, "sql_query": sql_query, "parsed_question": parsed_question})
+        return {"parsed_question": parsed_question, **fixed}
+
+    async def format_results(self, state: Dict[str, Any]) -> Dict[str, Any]:
         logger.info("========= format_results ========")
         required_keys = ["schema", "query_result"]
         missing_keys = [key for key in required_keys if key not in state]
@@ -115,11 +188,11 @@ class SQLAgent:
         if not self.llm or not self.str_parser:
             raise ValueError("LLM or String Parser is not initialized.")
 
-        chain = format_results_prompt | self.llm | self.str_parser
-        response = chain.invoke({"question": question, "results": results})
+        chain = get_format_results_prompt() | self.llm | self.str_parser
+        response = await chain.ainvoke({"question": question, "results": results})
         return {"answer": response}
 
-    def choose_visualization(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def choose_visualization(self, state: Dict[str, Any]) -> Dict[str, Any]:
         logger.info("========= choose_visualization ========")
         required_keys = ["question", "query_result", "sql_query"]
         missing_keys = [key for key in required_keys if key not in state]
@@ -134,9 +207,9 @@ class SQLAgent:
         if results == "NOT_RELEVANT":
             return {"visualization": "none", "visualization_reasoning": "No visualization needed for irrelevant questions."}
 
-        chain = get_visualization_prompt | self.llm | self.json_parser
+        chain = get_visualization_prompt() | self.llm | self.json_parser
 
-        response = chain.invoke(
+        response = await chain.ainvoke(
             {"question": question, "sql_query": sql_query, "results": results})
 
         return {
@@ -144,7 +217,7 @@ class SQLAgent:
             "reason": response["reason"]
         }
 
-    def format_visualization_data(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def format_visualization_data(self, state: Dict[str, Any]) -> Dict[str, Any]:
         logger.info("========= format_visualization_data ========")
 
         required_keys = ["question", "query_result",
@@ -166,15 +239,17 @@ class SQLAgent:
 
         prompt = get_prompt(recommended_visualization)
         chain = prompt | self.llm | self.json_parser
-        response = chain.invoke({"question": question, "data": results})
+        response = await chain.ainvoke({"question": question, "data": results})
 
         return {"formatted_data_for_visualization": response}
 
-    def conversational_response(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def conversational_response(self, state: Dict[str, Any]) -> Dict[str, Any]:
         logger.info("========= conversational_response ========")
+        if state.get('conversational_reply'):
+            return {"answer": state['conversational_reply']}
         question = state['question']
 
-        chain = conversational_prompt | self.llm | self.str_parser
-        response = chain.invoke({"question": question})
+        chain = get_conversational_prompt() | self.llm | self.str_parser
+        response = await chain.ainvoke({"question": question})
 
         return {"answer": response}
@@ -1,280 +1,336 @@
-from langchain_core.prompts import ChatPromptTemplate
-
-get_schema_insights_prompt = ChatPromptTemplate.from_messages([
-    ("system", '''
-            You are an expert data analyst tasked with analyzing SQL databases. Your goal is to interpret user questions, understand the provided schema, and identify relevant tables and columns.
-
-            Instructions:
-            1. Analyze the user question and database schema to identify relevant tables and columns.
-            2. **Default to "is_relevant": true** unless the question is clearly off-topic (e.g., "what's the weather", "tell me a joke", or unrelated non-data questions).
-            3. **Use fuzzy matching for table names**: If the user mentions any text that partially matches a table name (case-insensitive), set "is_relevant" to true. For example, "VanTC001" should match table "vantc001_a0634235".
-            4. **Be permissive with generic data questions**: Questions like "summarize", "show me data", "what is in the table", "analyze this data" should always be marked as relevant.
-            5. **When user just uploaded data**: Assume any question about data is relevant to the recently uploaded dataset.
-            6. Focus on columns with meaningful nouns (e.g., names, entities) and exclude non-noun columns (e.g., IDs, numerical data) unless specifically relevant to the question.
-            7. Return the response in the following JSON format, Please return the result in a valid JSON format. Do not use backticks, code blocks, or any extra characters:
-            {{
-            "is_relevant": boolean,
-            "relevant_tables": [
-                {{
-                "table_name": "string",
-                "columns": ["string"],
-                "noun_columns": ["string"]
-                }}
-            ]
-            }}
-
-            Key Guidelines:
-            - **Prioritize helpfulness**: When in doubt, mark the question as relevant and attempt to identify tables/columns.
-            - Always verify column names against the provided schema.
-            - Include only existing schema column names in the "columns" and "noun_columns" lists.
-            - "noun_columns" shouldn't include any numeric value verify the type from schema, type must be not Int, Bigint or any type of integer value .
-            - Do not add query-mentioned values or entities to "columns" or "noun_columns" unless they are actual column names in the schema.
-            - Ensure "noun_columns" contains only valid column names from the schema, matching their exact format.
-            - Include in "noun_columns" only noun-based columns relevant to the question (e.g., "artist_name" for "Who are the top-selling artists?").
-            - Exclude numerical or ID columns from "noun_columns" unless they represent meaningful entities.
-            - If a term in the query matches a likely column value rather than a column name (e.g., "Brazil" in "matches where Brazil scored"), do not include it in the lists.
-
-            Example:
-            Question: "What is the total number of matches where the Brazil team scored more than 2 goals?"
-            - Do not include "Brazil team" in columns or noun_columns as it's likely a value, not a column name.
-            - Include relevant columns like "team_name", "goals_scored" if they exist in the schema.
-
-    '''),
-    ("human",
-     "===Database Schema:\n{schema}\n\n===User Question:\n{question}\n\nIdentify the relevant tables and columns based on the provided information:")
-])
-
-generate_sql_query_prompt = ChatPromptTemplate.from_messages([
-    ("system", '''
-    You are an AI assistant that generates SQL queries based on user questions, database schema, and unique nouns found in the relevant tables. Your goal is to generate valid SQL queries that can directly answer the user's question.
-
-    ### Instructions:
-    1. Parse the user question, identify relevant tables and columns from the schema, and generate an SQL query using the correct table and column names.
-    2. Ensure the SQL query answers the question using only two or three columns in the result.
-    3. If there isn't enough information to generate a query, return "NOT_ENOUGH_INFO".
-    4. Always enclose table and column names in backticks (`) for SQL syntax consistency.
-    5. Skip rows where any column is NULL, empty (''), or contains 'N/A'.
-    6. Use the exact spellings of nouns from the unique nouns list, but only include nouns that match actual column names in the schema.
-    
-    Here are some examples:
-
-    1. **What is the top selling product?**
-       **Type**: Simple Aggregation  
-       **Answer**: 
-       ```sql
-       SELECT `product_name`, SUM(`quantity`) AS `total_quantity`
-       FROM `sales`
-       WHERE `product_name` IS NOT NULL AND `quantity` IS NOT NULL 
-       AND `product_name` != '' AND `quantity` != '' 
-       AND `product_name` != 'N/A' AND `quantity` != 'N/A' 
-       GROUP BY `product_name` 
-       ORDER BY `total_quantity` DESC 
-       LIMIT 1```
-         
-    2. **What is the total revenue for each product?**
-       **Type**: Revenue Calculation
-       **Answer**: 
-       ```sql
-         SELECT `product_name`, SUM(`quantity` * `price`) AS `total_revenue`
-         FROM `sales`
-         WHERE `product_name` IS NOT NULL AND `quantity` IS NOT NULL 
-         AND `price` IS NOT NULL AND `product_name` != '' 
-         AND `quantity` != '' AND `price` != '' 
-         AND `product_name` != 'N/A' AND `quantity` != 'N/A' 
-         AND `price` != 'N/A'
-         GROUP BY `product_name`
-         ORDER BY `total_revenue` DESC
-         ```
-
-    3. **What is the market share of each product?** 
-       **Type**: Market Share Calculation
-       **Answer**:
-       ```sql
-         SELECT `product_name`, 
-         SUM(`quantity`) * 100.0 / (SELECT SUM(`quantity`) FROM `sales`) AS `market_share`
-         FROM `sales`
-         WHERE `product_name` IS NOT NULL AND `quantity` IS NOT NULL 
-         AND `product_name` != '' AND `quantity` != '' 
-         AND `product_name` != 'N/A' AND `quantity` != 'N/A'
-         GROUP BY `product_name`
-         ORDER BY `market_share` DESC
-         ```
-    4. **Which customers purchased the top-selling products?** 
-       **Type**: Join Query
-       **Answer**:
-        ```sql
-         SELECT `customers`.`customer_name`, `sales`.`product_name`, `sales`.`total_quantity`
-         FROM `customers`
-         JOIN `sales` ON `customers`.`customer_id` = `sales`.`customer_id`
-         WHERE `sales`.`total_quantity` = (
-             SELECT MAX(`total_quantity`) FROM `sales`
-         )
-        ```
-
-    5. **Plot the distribution of income over time.**
-       **Type**: Distribution Plot
-       **Answer**:
-         ```sql
-         SELECT `income`, COUNT(*) AS `count`
-         FROM `users`
-         WHERE `income` IS NOT NULL AND `income` != '' AND `income` != 'N/A'
-         GROUP BY `income`
-        ```
-
-    6. **What is the total sales between 2021 and 2023?**
-       **Type**: Date Range Query
-       **Answer**:
-         ```sql
-         SELECT SUM(`quantity` * `price`) AS `total_sales`
-         FROM `sales`
-         WHERE `sale_date` BETWEEN '2021-01-01' AND '2023-12-31'
-         ```
-    7. **Find the total sales for each region, including customer count**
-       **Type**: Complex Aggregation
-       **Answer**:
-         ```sql
-         SELECT `regions`.`region_name`, SUM(`sales`.`quantity` * `sales`.`price`) AS `total_sales`, COUNT(DISTINCT `customers`.`customer_id`) AS `customer_count`
-         FROM `sales`
-         JOIN `customers` ON `sales`.`customer_id` = `customers`.`customer_id`
-         JOIN `regions` ON `customers`.`region_id` = `regions`.`region_id`
-         GROUP BY `regions`.`region_name`
-         ORDER BY `total_sales` DESC
-         ```
-         
-    ### Format for Results:
-    - For simple queries (without labels): `[[x, y]]`
-    - For queries with labels: `[[label, x, y]]`
-
-    Just return the SQL query string based on the schema, question, and unique nouns provided.
-    '''),
-    ("human", '''===Database schema: {schema}
+import hashlib
+import re
+from functools import lru_cache
+from pathlib import Path
+from string import Formatter
+from typing import Any, Dict, List, Optional, Tuple
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableLambda
+
+_PROMPTS_DIR = Path(__file__).parent / "prompts"
+
+
+@lru_cache(maxsize=None)
+def _segments(template_key: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """
+    Pre-parse a human template into (literal, field_name) segments.
+
+    Escaped braces are resolved here once, so rendering is plain concatenation.
+    """
+    segments = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(_TEMPLATES[template_key]):
+        if format_spec or conversion:
+            raise ValueError(f"Unsupported placeholder in {template_key} template: {{{field_name}}}")
+        segments.append((literal, field_name))
+    return tuple(segments)
+
+
+def _render(template_key: str, values: Dict[str, Any]) -> str:
+    parts = []
+    for literal, field_name in _segments(template_key):
+        parts.append(literal)
+        if field_name is not None:
+            value = values[field_name]
+            parts.append(value if isinstance(value, str) else str(value))
+    return "".join(parts)
+
+
+def format_prompt(template_key: str, **kwargs: Any) -> List[BaseMessage]:
+    """
+    Format a registered prompt.
+
+    Only the static parts are cached: the shared SystemMessage and the
+    pre-parsed template segments. The human message carries per-request
+    data (schemas, query results) and is rendered on every call.
+
+    Args:
+        template_key: Key of the prompt in _TEMPLATES
+        **kwargs: Template variables
+
+    Returns:
+        [SystemMessage, HumanMessage] for the prompt
+    """
+    return [_system_message(template_key), HumanMessage(content=_render(template_key, kwargs))]
+
+
+@lru_cache(maxsize=None)
+def get_system_text(template_key: str) -> str:
+    """Read a prompt's system text from prompts/<template_key>.txt, once per process."""
+    return (_PROMPTS_DIR / f"{template_key}.txt").read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=None)
+def prompt_cache_key(template_key: str) -> str:
+    """Provider prompt-cache key derived from a prompt's static system text."""
+    digest = hashlib.blake2b(get_system_text(template_key).encode(), digest_size=8).hexdigest()
+    return f"{template_key}-{digest}"
+
+
+@lru_cache(maxsize=None)
+def _system_message(template_key: str) -> SystemMessage:
+    """Build a prompt's SystemMessage once and share it by reference across requests."""
+    return SystemMessage(content=get_system_text(template_key))
+
+
+def _static_prompt(template_key: str) -> RunnableLambda:
+    """
+    Build a prompt runnable from a static system message and a human template.
+
+    The human template is formatted through format_prompt.
+    """
+    def format_messages(inputs: Dict[str, Any]) -> List[BaseMessage]:
+        return format_prompt(template_key, **inputs)
+
+    return RunnableLambda(format_messages)
+
+
+_SCHEMA_INSIGHTS_HUMAN = "===Database Schema:\n{schema}\n\n===User Question:\n{question}\n\nIdentify the relevant tables and columns based on the provided information:"
+
+
+@lru_cache(maxsize=None)
+def get_schema_insights_prompt() -> RunnableLambda:
+    return _static_prompt("schema_insights")
+
+
+_GENERATE_SQL_HUMAN = '''===Database schema: {schema}
 
     ===User question: {question}
 
     ===Relevant tables and columns: {relevant_table_column}
       
 
-    Generate SQL query string:''')
-])
-
-fix_sql_query_prompt = ChatPromptTemplate.from_messages([
-    ("system", '''
-    You are an AI assistant that validates and fixes SQL queries. Your task is to:
-    1. Check if the SQL query is valid.
-    2. Ensure all table and column names are correctly spelled and exist in the schema. All table and column names should be enclosed in backticks, especially if they contain spaces or special characters.
-    3. Ensure the SQL query follows proper syntax (e.g., `JOIN`, `WHERE`, and other clauses are used correctly).
-    4. Take into account case sensitivity based on the schema.
-    5. If there are any issues, fix them and provide the corrected SQL query.
-    6. If no issues are found, return the original query.
-
-    Only respond with the JSON, Please return the result in a valid JSON format. Do not use backticks, code blocks, or any extra characters, The format should be like this::
-    {{
-        "valid": boolean,
-        "issues": string or null,
-        "corrected_query": string
-    }}
-    '''),
-    ("human", '''===Database schema:
+    Generate SQL query string:'''
+
+
+# Extra few-shot examples, appended after the per-request content (so the
+# system prompt stays a cacheable prefix) only for matching question types.
+SQL_EXAMPLES: Dict[str, str] = {
+    "market_share": '''
+    **What is the market share of each product?**
+    **Type**: Market Share Calculation
+    **Answer**:
+    ```sql
+    SELECT `product_name`,
+    SUM(`quantity`) * 100.0 / (SELECT SUM(`quantity`) FROM `sales`) AS `market_share`
+    FROM `sales`
+    GROUP BY `product_name`
+    ORDER BY `market_share` DESC
+    ```''',
+    "join": '''
+    **Which customers purchased the top-selling products?**
+    **Type**: Join Query
+    **Answer**:
+    ```sql
+    SELECT `customers`.`customer_name`, `sales`.`product_name`, `sales`.`total_quantity`
+    FROM `customers`
+    JOIN `sales` ON `customers`.`customer_id` = `sales`.`customer_id`
+    WHERE `sales`.`total_quantity` = (
+        SELECT MAX(`total_quantity`) FROM `sales`
+    )
+    ```''',
+    "distribution": '''
+    **Plot the distribution of income over time.**
+    **Type**: Distribution Plot
+    **Answer**:
+    ```sql
+    SELECT `income`, COUNT(*) AS `count`
+    FROM `users`
+    GROUP BY `income`
+    ```''',
+    "date_range": '''
+    **What is the total sales between 2021 and 2023?**
+    **Type**: Date Range Query
+    **Answer**:
+    ```sql
+    SELECT SUM(`quantity` * `price`) AS `total_sales`
+    FROM `sales`
+    WHERE `sale_date` BETWEEN '2021-01-01' AND '2023-12-31'
+    ```''',
+    "complex_aggregation": '''
+    **Find the total sales for each region, including customer count**
+    **Type**: Complex Aggregation
+    **Answer**:
+    ```sql
+    SELECT `regions`.`region_name`, SUM(`sales`.`quantity` * `sales`.`price`) AS `total_sales`, COUNT(DISTINCT `customers`.`customer_id`) AS `customer_count`
+    FROM `sales`
+    JOIN `customers` ON `sales`.`customer_id` = `customers`.`customer_id`
+    JOIN `regions` ON `customers`.`region_id` = `regions`.`region_id`
+    GROUP BY `regions`.`region_name`
+    ORDER BY `total_sales` DESC
+    ```''',
+}
+
+_QUERY_TYPE_PATTERNS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = (
+    ("market_share", re.compile(r"\b(share|percent(age)?|proportion|ratio)\b|%", re.IGNORECASE)),
+    ("distribution", re.compile(r"\b(distribution|histogram|spread|frequency)\b", re.IGNORECASE)),
+    ("date_range", re.compile(r"\b(between|since|before|after|during|year|month|quarter|(19|20)\d{2})\b", re.IGNORECASE)),
+)
+_MAX_EXTRA_EXAMPLES = 2
+
+
+def detect_sql_query_types(question: str, parsed_question: Any = None) -> Tuple[str, ...]:
+    """
+    Pick up to two SQL_EXAMPLES keys that match the shape of a question.
+
+    Args:
+        question: The user's question
+        parsed_question: Output of the schema-insights step, if available
+
+    Returns:
+        Tuple of SQL_EXAMPLES keys, most relevant first
+    """
+    query_types = []
+    relevant_tables = (parsed_question.get("relevant_tables") or []) if isinstance(parsed_question, dict) else []
+    if len(relevant_tables) > 2:
+        query_types.append("complex_aggregation")
+    elif len(relevant_tables) == 2:
+        query_types.append("join")
+    query_types.extend(name for name, pattern in _QUERY_TYPE_PATTERNS if pattern.search(question))
+    return tuple(query_types[:_MAX_EXTRA_EXAMPLES])
+
+
+@lru_cache(maxsize=None)
+def _sql_examples_message(query_types: Tuple[str, ...]) -> Optional[HumanMessage]:
+    if not query_types:
+        return None
+    examples = "\n".join(SQL_EXAMPLES[query_type] for query_type in query_types)
+    return HumanMessage(content=f"More examples for this kind of question:\n{examples}")
+
+
+@lru_cache(maxsize=None)
+def get_generate_sql_query_prompt() -> RunnableLambda:
+    """
+    SQL generation prompt. Pass `query_types` (see detect_sql_query_types) to
+    append the matching extra examples after the per-request message.
+    """
+    def format_messages(inputs: Dict[str, Any]) -> List[BaseMessage]:
+        inputs = dict(inputs)
+        extra_examples = _sql_examples_message(tuple(inputs.pop("query_types", ())))
+        messages = format_prompt("generate_sql", **inputs)
+        if extra_examples is not None:
+            messages.append(extra_examples)
+        return messages
+
+    return RunnableLambda(format_messages)
+
+
+# Only per-request content goes in the human message so the system prompt
+# stays a byte-identical prefix that providers can cache.
+_FIX_SQL_HUMAN = '''===Database schema:
     {schema}
 
     ===Generated SQL query:
     {sql_query}
 
-    Respond in JSON format with the following structure. Only respond with the JSON Please return the result in a valid JSON format. Do not use backticks, code blocks, or any extra characters:
-    {{
-        "valid": boolean,
-        "issues": string or null,
-        "corrected_query": string
-    }}
-
-    For example:
-    1. {{
-        "valid": true,
-        "issues": null,
-        "corrected_query": "None"
-    }}
-                
-    2. {{
-        "valid": false,
-        "issues": "Column USERS does not exist",
-        "corrected_query": "SELECT * FROM \`users\` WHERE age > 25"
-    }}
-
-    3. {{
-        "valid": false,
-        "issues": "Column names and table names should be enclosed in backticks if they contain spaces or special characters",
-        "corrected_query": "SELECT * FROM \`gross income\` WHERE \`age\` > 25"
-    }}
-                
-    '''),
-])
-
-format_results_prompt = ChatPromptTemplate.from_messages([
-    ("system", '''
-    You are an AI data analyst assistant that transforms database query results into comprehensive, insightful natural language summaries. Your goal is to help users understand their data through clear, well-structured analysis.
-
-    Instructions:
-    1. **Generate a comprehensive summary (2-4 paragraphs)** that directly answers the user's question
-    2. **Start with an overview** - Provide a clear introduction summarizing what the data shows
-    3. **Include key findings** - Highlight important statistics, trends, patterns, or insights from the data
-    4. **Add context and analysis** - Explain what the results mean and why they matter
-    5. **Use natural language** - Write in a conversational, easy-to-understand style
-    6. **Structure your response clearly** - Use paragraphs to organize different aspects of your analysis
-    7. **Highlight important values** using **bold** for emphasis (e.g., **177 test fields**, **VanTC001**)
-    8. **Be specific** - Reference actual values, counts, and data points from the query results
-
-    Example structure:
-    - Paragraph 1: Direct answer to the question with main finding
-    - Paragraph 2: Key statistics and detailed breakdown
-    - Paragraph 3: Additional insights, patterns, or context (if applicable)
-
-    Important: Focus on being informative and helpful. Don't just list the data - interpret it and explain what it means for the user.
-    '''),
-    ("human",
-     "User question: {question}\n\nQuery results: {results}\n\nPlease provide a comprehensive natural language summary:")
-])
-
-get_visualization_prompt = ChatPromptTemplate.from_messages([
-    ("system", '''
-    You are an AI assistant recommending the best data visualizations. Based on the user's question, SQL query, and query results, suggest the most suitable graph or chart type.
-
-    ### Chart Types:
-    - **Bar Graph**: For comparing categorical data or showing changes over time with more than two categories.
-    - **Horizontal Bar Graph**: For comparing few categories or when there's a large disparity between them.
-    - **Scatter Plot**: For showing relationships or distributions between two continuous numerical variables.
-    - **Pie Chart**: For displaying proportions or percentages of a whole.
-    - **Line Graph**: For showing trends over time, where both x and y axes are continuous.
-    - **None**: If no visualization is appropriate.
-
-    ### Consider These Questions:
-    1. **Aggregations**: Summarize data (e.g., average revenue by month) — Line Graph.
-    2. **Comparisons**: Compare metrics (e.g., sales of Product A vs. Product B) — Line or Bar Graph.
-    3. **Distributions**: Show data distribution (e.g., age distribution) — Scatter Plot.
-    4. **Trends Over Time**: Show changes over time (e.g., website visits) — Line Graph.
-    5. **Proportions**: Show percentages (e.g., market share) — Pie Chart.
-    6. **Correlations**: Show relationships (e.g., marketing spend vs. revenue) — Scatter Plot.
-
-    ### Format:
-         {{
-            recommended_visualization: string (bar | horizontal_bar | line | pie | scatter | none),
-            reason: Brief explanation of your recommendation
-         }}
-    Please return the result in a valid JSON format. Do not use backticks, code blocks, or any extra characters
-    '''),
-    ("human", '''
+    Respond with the JSON only:'''
+
+
+@lru_cache(maxsize=None)
+def get_fix_sql_query_prompt() -> RunnableLambda:
+    return _static_prompt("fix_sql")
+
+
+_FORMAT_RESULTS_HUMAN = "User question: {question}\n\nQuery results: {results}\n\nPlease provide a comprehensive natural language summary:"
+
+
+@lru_cache(maxsize=None)
+def get_format_results_prompt() -> RunnableLambda:
+    return _static_prompt("format_results")
+
+
+_VISUALIZATION_HUMAN = '''
     User question: {question}
     SQL query: {sql_query}
     Query results: {results}
 
     Recommend a visualization:
-        '''),
-])
+        '''
 
-conversational_prompt = ChatPromptTemplate.from_messages([
-    ("system", "You are LUMIN, a data analyst. Your job is to help the user gain insights from their data. kindly ask the user to provide a more relevant question based on the dataset."),
-    ("human", '''
+
+@lru_cache(maxsize=None)
+def get_visualization_prompt() -> RunnableLambda:
+    return _static_prompt("visualization")
+
+
+_CONVERSATIONAL_HUMAN = '''
     Question: {question}
     
     Please answer the question & kindly ask the user to ask a question that is more relevant to the selected data.
-    '''),
-])
+    '''
+
+
+@lru_cache(maxsize=None)
+def get_conversational_prompt() -> RunnableLambda:
+    return _static_prompt("conversational")
+
+
+_UNIFIED_SQL_HUMAN = '''===Database schema: {schema}
+
+    ===User question: {question}
+
+    Respond with the JSON only:'''
+
+# Response schema for the fused schema-insights + SQL generation + validation
+# call, which also carries the conversational reply for off-topic questions
+UNIFIED_SQL_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "is_relevant": {"type": "boolean"},
+        "relevant_tables": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "table_name": {"type": "string"},
+                    "columns": {"type": "array", "items": {"type": "string"}},
+                    "noun_columns": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["table_name", "columns", "noun_columns"],
+                "additionalProperties": False,
+            },
+        },
+        "sql_query": {"type": "string"},
+        "validation": {
+            "type": "object",
+            "properties": {
+                "valid": {"type": "boolean"},
+                "issues": {"type": ["string", "null"]},
+            },
+            "required": ["valid", "issues"],
+            "additionalProperties": False,
+        },
+        # Conversational answer for questions that aren't about the data
+        "reply": {"type": ["string", "null"]},
+    },
+    "required": ["is_relevant", "relevant_tables", "sql_query", "validation", "reply"],
+    "additionalProperties": False,
+}
+
+
+@lru_cache(maxsize=None)
+def get_unified_sql_prompt() -> RunnableLambda:
+    """
+    Single prompt covering schema insights, SQL generation and validation.
+    Accepts `query_types` like get_generate_sql_query_prompt.
+    """
+    def format_messages(inputs: Dict[str, Any]) -> List[BaseMessage]:
+        inputs = dict(inputs)
+        extra_examples = _sql_examples_message(tuple(inputs.pop("query_types", ())))
+        messages = format_prompt("unified_sql", **inputs)
+        if extra_examples is not None:
+            messages.append(extra_examples)
+        return messages
+
+    return RunnableLambda(format_messages)
+
+
+# template_key -> human template; system texts live in prompts/<template_key>.txt
+_TEMPLATES: Dict[str, str] = {
+    "schema_insights": _SCHEMA_INSIGHTS_HUMAN,
+    "generate_sql": _GENERATE_SQL_HUMAN,
+    "fix_sql": _FIX_SQL_HUMAN,
+    "format_results": _FORMAT_RESULTS_HUMAN,
+    "visualization": _VISUALIZATION_HUMAN,
+    "conversational": _CONVERSATIONAL_HUMAN,
+    "unified_sql": _UNIFIED_SQL_HUMAN,
+}
@@ -1,6 +1,7 @@
 from typing import List, Any, Annotated, Dict
 from typing_extensions import TypedDict
 import operator
+import asyncio
 from langchain_core.language_models import BaseLLM
 from langgraph.graph import START, END, StateGraph
 from app.langgraph.agents.sql_agent import SQLAgent
@@ -29,6 +30,7 @@ class InputState(TypedDict):
     question: str
     schema: List[Dict]
     parsed_question: dict
+    conversational_reply: str
     sql_query: str
     sql_valid: bool
     sql_issues: str
@@ -38,6 +40,8 @@ class InputState(TypedDict):
     visualization: Annotated[str, operator.add]
     visualization_reason: Annotated[str, operator.add]
     formatted_data_for_visualization: Dict[str, Any]
+    answer: Annotated[str, operator.add]
+    error: str
 
 
 class OutputState(TypedDict):
@@ -58,9 +62,17 @@ class OutputState(TypedDict):
 
 
 class WorkflowManager:
-    def __init__(self, llm: BaseLLM, db: DB):
+    def __init__(self, llm: BaseLLM, db: DB, legacy: bool = False):
+        """
+        Args:
+            llm: LLM used by every agent node
+            db: Database the generated queries run against
+            legacy: Use the three-call parse/generate/validate SQL path
+                instead of the single unified_sql call
+        """
         self.llm = llm
         self.db = db
+        self.legacy = legacy
         self.sql_agent = SQLAgent(llm)
 
     def serialize_row(self, row):
@@ -113,10 +125,15 @@ class WorkflowManager:
         workflow = StateGraph(InputState)
 
         # Add nodes to the graph
-        workflow.add_node("parse_question", self.sql_agent.get_parse_question)
-        workflow.add_node("generate_sql", self.sql_agent.generate_sql_query)
-        workflow.add_node("validate_and_fix_sql",
-                          self.sql_agent.validate_and_fix_sql)
+        if self.legacy:
+            workflow.add_node("parse_question", self.sql_agent.get_parse_question)
+            workflow.add_node("generate_sql", self.sql_agent.generate_sql_query)
+            workflow.add_node("validate_and_fix_sql",
+                              self.sql_agent.validate_and_fix_sql)
+            entry_node = "parse_question"
+        else:
+            workflow.add_node("unified_sql", self.sql_agent.unified_sql)
+            entry_node = "unified_sql"
         workflow.add_node("execute_sql", self.run_sql_query)
         workflow.add_node("format_results", self.sql_agent.format_results)
         workflow.add_node("choose_visualization",
@@ -129,16 +146,17 @@ class WorkflowManager:
                           self.sql_agent.conversational_response)
 
         # Define edges
-        workflow.add_edge(START, "parse_question")
+        workflow.add_edge(START, entry_node)
 
         # Add conditional edge to check if the conversation should continue or end
         workflow.add_conditional_edges(
-            "parse_question",  # Start after parsing question
+            entry_node,  # Start after parsing question
             self.should_continue  # Conditional function to determine the next node
         )
 
-        workflow.add_edge("generate_sql", "validate_and_fix_sql")
-        workflow.add_edge("validate_and_fix_sql", "execute_sql")
+        if self.legacy:
+            workflow.add_edge("generate_sql", "validate_and_fix_sql")
+            workflow.add_edge("validate_and_fix_sql", "execute_sql")
         workflow.add_edge("execute_sql", "format_results")
         workflow.add_edge("execute_sql", "choose_visualization")
         workflow.add_edge("choose_visualization",
@@ -158,15 +176,19 @@ class WorkflowManager:
         if not parsed_question.get("is_relevant", True):
             return "conversational_response"
 
-        # Otherwise, proceed with the SQL generation
-        return "generate_sql"
+        # Otherwise, proceed with the SQL generation (already done by unified_sql)
+        return "generate_sql" if self.legacy else "execute_sql"
 
     def returnGraph(self):
         return self.create_workflow().compile()
 
     def run_sql_agent(self, question: str, schema: List[Dict]) -> dict:
         """Run the SQL agent workflow and return the formatted answer and visualization recommendation."""
-        app = self.create_workflow().compile()
-        for event in app.stream({"question": question, "schema": schema}):
-            for value in event.values():
-                print(value)
\ No newline at end of file
+        # The agent nodes are async, so the graph is driven through astream
+        async def run():
+            app = self.create_workflow().compile()
+            async for event in app.astream({"question": question, "schema": schema}):
+                for value in event.values():
+                    print(value)
+
+        asyncio.run(run())
\ No newline at end of file
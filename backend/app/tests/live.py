@@ -0,0 +1,18 @@
+"""Shared opt-in for test scripts that make live API calls."""
+
+import os
+import sys
+
+
+def should_run_live(prompt: str) -> bool:
+    """
+    Decide whether to run tests that make live API calls.
+
+    RUN_LIVE_TESTS=1 opts in without prompting; otherwise the user is only
+    asked when stdin is a terminal, so CI runs never block on input().
+    """
+    if os.environ.get("RUN_LIVE_TESTS", "0") == "1":
+        return True
+    if not sys.stdin.isatty():
+        return False
+    return input(prompt).lower() == 'y'
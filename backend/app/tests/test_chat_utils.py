@@ -0,0 +1,143 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# chat_utils builds the system database from the environment at import time
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from app.api.db.chat_history import Messages
+from app.config.db_config import DB
+from app.config.llm_config import LLM
+from app.utils import chat_utils
+from app.utils.chat_utils import (_conversation_history, execute_direct_chat, execute_workflow, save_message,
+                                  save_messages, should_use_data_analysis)
+
+
+class TestShouldUseDataAnalysis(unittest.TestCase):
+    CASES = [
+        ("How many orders were placed?", True),
+        ("count rows per region", True),
+        ("Show the top 5 products", True),
+        ("totals per month", True),
+        ("Sort by price", True),
+        ("Plot revenue where region is EU", True),
+        # Explanations go to direct chat even with a SQL keyword
+        ("What is the total revenue?", False),
+        ("Total sales summarized by region", False),
+        # Keywords only match at the start of a word
+        ("Tell me about my account", False),
+        ("Which consumer segments exist?", False),
+        ("Show the selection", False),
+        ("When was this updated?", False),
+        ("hi", False),
+        ("thanks!", False),
+    ]
+
+    def test_routing(self):
+        for question, expected in self.CASES:
+            with self.subTest(question=question):
+                self.assertEqual(should_use_data_analysis(question, True), expected)
+
+    def test_no_uploaded_data(self):
+        self.assertFalse(should_use_data_analysis("How many orders were placed?", False))
+
+
+class TestDirectChatStream(unittest.TestCase):
+    def test_ndjson_frames(self):
+        api = FastAPI()
+        api.get("/")(lambda: execute_direct_chat("hi", 0, LLM(), llm_model="gpt-4o-mini"))
+        model = FakeListChatModel(responses=["hey"])
+        with patch.object(LLM, "get_model", return_value=model):
+            response = TestClient(api).get("/")
+
+        self.assertEqual(response.headers["content-type"], "application/x-ndjson")
+        frames = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual([frame["data"]["delta"] for frame in frames[:-2]], ["h", "e", "y"])
+        self.assertEqual(frames[-2]["data"]["answer"], "hey")
+        self.assertEqual(frames[-1], {"done": True})
+
+
+class TestCompiledApp(unittest.TestCase):
+    def test_fallback_is_not_pinned(self):
+        fallback = FakeListChatModel(responses=["fallback"])
+        requested = FakeListChatModel(responses=["requested"])
+        llm = LLM()
+        with patch.object(chat_utils, "model_id", side_effect=lambda model: "fallback" if model is fallback else "gpt-4o"), \
+                patch.object(LLM, "get_model", side_effect=[fallback, requested]), \
+                patch.object(chat_utils, "_compiled_app") as compiled_app:
+            for _ in range(2):
+                execute_workflow("How many orders?", 0, [], llm, llm_model="gpt-4o", system_db=DB("sqlite://"))
+        # Once the requested model resolves, the fallback's app isn't reused
+        self.assertEqual([call.args[1] for call in compiled_app.call_args_list], ["fallback", "gpt-4o"])
+
+
+class TestConversationHistory(unittest.TestCase):
+    def setUp(self):
+        # A file database, so threadpool sessions see the same tables
+        handle, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        self.db = DB(f"sqlite:///{self.path}")
+        Messages.__table__.create(self.db.engine)
+        chat_utils._history_cache.clear()
+
+    def tearDown(self):
+        self.db.engine.dispose()
+        os.remove(self.path)
+
+    def test_load_save_load(self):
+        save_messages(1, [("user", {"question": "hi"}), ("assistant", {"answer": "hello"})], self.db)
+        self.assertEqual(_conversation_history(self.db, 1), [
+            {"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello"}])
+
+        save_message(1, "user", {"question": "and then?"}, self.db)
+        self.assertEqual(_conversation_history(self.db, 1)[-1], {"role": "user", "content": "and then?"})
+
+    def test_excludes_the_question_being_answered(self):
+        save_message(1, "assistant", {"answer": "hello"}, self.db)
+        question = save_message(1, "user", {"question": "what next?"}, self.db)
+        self.assertEqual(_conversation_history(self.db, 1, question["id"]),
+                         [{"role": "assistant", "content": "hello"}])
+
+    def test_picks_up_messages_committed_out_of_id_order(self):
+        with self.db.session() as session:
+            session.add(Messages(id=2, conversation_id=1, role="user", content={"question": "second"}))
+            session.commit()
+        self.assertEqual(len(_conversation_history(self.db, 1)), 1)
+
+        # Written by another worker with a lower id after the first read
+        with self.db.session() as session:
+            session.add(Messages(id=1, conversation_id=1, role="user", content={"question": "first"}))
+            session.commit()
+        self.assertEqual([entry["content"] for entry in _conversation_history(self.db, 1)], ["first", "second"])
+
+    def test_loads_saved_message_formats(self):
+        save_messages(1, [
+            ("user", {"question": "total sales?"}),
+            # Workflow answers store every step, older ones as JSON strings
+            ("assistant", {"answer": ['{"sql_query": "SELECT 1"}', '{"answer": "42"}']}),
+            ("assistant", {"answer": [{"answer": "43"}]}),
+            ("assistant", "plain text"),
+            ("assistant", {"answer": []}),
+        ], self.db)
+        self.assertEqual(_conversation_history(self.db, 1), [
+            {"role": "user", "content": "total sales?"},
+            {"role": "assistant", "content": "42"},
+            {"role": "assistant", "content": "43"},
+            {"role": "assistant", "content": "plain text"},
+        ])
+        self.assertEqual(_conversation_history(self.db, 2), [])
+
+    def test_keeps_the_last_messages(self):
+        save_messages(1, [("user", {"question": str(n)}) for n in range(chat_utils.HISTORY_LENGTH + 5)], self.db)
+        history = _conversation_history(self.db, 1)
+        self.assertEqual(len(history), chat_utils.HISTORY_LENGTH)
+        self.assertEqual(history[-1]["content"], str(chat_utils.HISTORY_LENGTH + 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -39,6 +39,24 @@ class TestDB(unittest.TestCase):
         self.assertEqual(schemas[0]['table_name'], 'users')
         self.assertEqual(schemas[0]['schema'][0]['name'], 'id')
 
+    @patch('app.config.db_config.inspect')
+    def test_get_schemas_is_cached(self, mock_inspect):
+        mock_inspector = mock_inspect.return_value
+        mock_inspector.get_columns.return_value = [
+            {'name': 'id', 'type': 'INTEGER', 'nullable': False}]
+
+        first = self.db.get_schemas(['orders'])
+        second = self.db.get_schemas(['orders'])
+
+        # The second lookup is served from the cache
+        self.assertEqual(first, second)
+        mock_inspector.get_columns.assert_called_once_with('orders')
+
+        # Invalidation forces a fresh lookup
+        self.db.invalidate_schema('orders')
+        self.db.get_schemas(['orders'])
+        self.assertEqual(mock_inspector.get_columns.call_count, 2)
+
     # @patch('app.config.db_config.create_engine')
     # def test_execute_query(self, mock_create_engine):
     #     # Mock the result of the query
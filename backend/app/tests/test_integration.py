@@ -8,11 +8,15 @@ Usage:
     python -m app.tests.test_integration
 """
 
+import asyncio
+import os
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, List
+import pytest
 from app.config.llm_config import LLM, DEFAULT_MODELS
 from app.langgraph.agents.sql_agent import SQLAgent
 from app.config.env import OPENAI_API_KEY, GROQ_API_KEY
+from app.tests.live import should_run_live
 
 
 def print_header(text: str):
@@ -32,6 +36,17 @@ def print_error(text: str):
     print(f"❌ {text}")
 
 
+def _configured_models() -> List[str]:
+    """Models to test, one per platform with an API key configured"""
+    models = []
+    if OPENAI_API_KEY:
+        models.append("gpt-4o-mini")
+    if GROQ_API_KEY:
+        models.append("gemma2-9b-it")
+    return models
+
+
+@pytest.mark.parametrize("model_name", ["gpt-4o-mini", "gemma2-9b-it"])
 def test_sql_agent_with_model(model_name: str) -> bool:
     """
     Test SQLAgent with a specific model.
@@ -42,6 +57,12 @@ def test_sql_agent_with_model(model_name: str) -> bool:
     Returns:
         True if test passed, False otherwise
     """
+    if model_name not in _configured_models() or os.environ.get("RUN_LIVE_TESTS", "0") != "1":
+        pytest.skip("Set RUN_LIVE_TESTS=1 and the model's API key to run live tests")
+    return asyncio.run(_sql_agent_with_model_async(model_name))
+
+
+async def _sql_agent_with_model_async(model_name: str) -> bool:
     try:
         # Initialize LLM
         llm_instance = LLM()
@@ -55,7 +76,7 @@ def test_sql_agent_with_model(model_name: str) -> bool:
             'question': 'Hello, how are you?'
         }
 
-        result = sql_agent.conversational_response(test_state)
+        result = await sql_agent.conversational_response(test_state)
 
         if 'answer' in result and result['answer']:
             print_success(f"{model_name}: SQL Agent integration successful")
@@ -70,18 +91,30 @@ def test_sql_agent_with_model(model_name: str) -> bool:
         return False
 
 
-def test_model_switching():
+@pytest.mark.parametrize("model_name", ["gpt-4o-mini", "gemma2-9b-it"])
+def test_model_switching(model_name: str):
+    """Test switching to a specific model"""
+    if model_name not in _configured_models():
+        pytest.skip(f"No API key configured for {model_name}")
+    _switch_model(LLM(), model_name)
+
+
+def _switch_model(llm_instance: LLM, model_name: str):
+    try:
+        model = llm_instance.get_model(model_name)
+        print_success(f"Switched to {model_name} (current: {model.model_name})")
+    except Exception as e:
+        print_error(f"Failed to switch to {model_name}: {str(e)}")
+
+
+def run_model_switching():
     """Test switching between different models"""
     print_header("Testing Model Switching")
 
     llm_instance = LLM()
 
     # Test switching between models
-    models_to_test = []
-    if OPENAI_API_KEY:
-        models_to_test.append("gpt-4o-mini")
-    if GROQ_API_KEY:
-        models_to_test.append("gemma2-9b-it")
+    models_to_test = _configured_models()
 
     if not models_to_test:
         print_error("No API keys configured - skipping model switching test")
@@ -90,11 +123,7 @@ def test_model_switching():
     print(f"Testing model switching with {len(models_to_test)} models...\n")
 
     for model_name in models_to_test:
-        try:
-            model = llm_instance.get_model(model_name)
-            print_success(f"Switched to {model_name} (current: {llm_instance.current_model})")
-        except Exception as e:
-            print_error(f"Failed to switch to {model_name}: {str(e)}")
+        _switch_model(llm_instance, model_name)
 
 
 def test_task_based_selection():
@@ -109,7 +138,7 @@ def test_task_based_selection():
         try:
             model = llm_instance.get_model_for_task(task)
             expected_model = DEFAULT_MODELS.get(task)
-            actual_model = llm_instance.current_model
+            actual_model = model.model_name
 
             if actual_model == expected_model or actual_model == DEFAULT_MODELS['fallback']:
                 print_success(f"{task}: Got model {actual_model}")
@@ -130,7 +159,7 @@ def test_error_handling():
     print("Test 1: Invalid model with fallback enabled")
     try:
         model = llm_instance.get_model("invalid-model-12345", fallback=True)
-        print_success(f"Fallback successful - using {llm_instance.current_model}")
+        print_success(f"Fallback successful - using {model.model_name}")
     except Exception as e:
         print_error(f"Fallback failed: {str(e)}")
 
@@ -162,27 +191,25 @@ def main():
         test_task_based_selection()
 
         # Test 2: Model switching
-        test_model_switching()
+        run_model_switching()
 
         # Test 3: Error handling
         test_error_handling()
 
         # Test 4: SQL Agent integration (optional)
         print("\n" + "=" * 80)
-        response = input("Run SQL Agent integration tests with API calls? (y/N): ")
-        if response.lower() == 'y':
+        if should_run_live("Run SQL Agent integration tests with API calls? (y/N): "):
             print_header("Testing SQL Agent Integration")
 
-            models_to_test = []
-            if OPENAI_API_KEY:
-                models_to_test.append("gpt-4o-mini")
-            if GROQ_API_KEY:
-                models_to_test.append("gemma2-9b-it")
+            models_to_test = _configured_models()
+
+            async def run_all():
+                return await asyncio.gather(
+                    *(_sql_agent_with_model_async(model_name) for model_name in models_to_test),
+                    return_exceptions=True)
 
-            success_count = 0
-            for model_name in models_to_test:
-                if test_sql_agent_with_model(model_name):
-                    success_count += 1
+            results = asyncio.run(run_all())
+            success_count = sum(1 for result in results if result is True)
 
             print(f"\n{'='*80}")
             print(f"SQL Agent Integration: {success_count}/{len(models_to_test)} successful")
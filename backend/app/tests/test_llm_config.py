@@ -0,0 +1,116 @@
+import asyncio
+import unittest
+import httpx
+from unittest.mock import patch
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import HumanMessage
+from app.config import llm_config
+from app.config.llm_config import LLM, _cache_key, _get_ChatOpenAI, with_json_schema, with_prompt_cache_key
+from app.utils.llm_utils import LoopLocalTransport, ResponseCache, response_cache
+
+
+SCHEMA = {"type": "object", "properties": {}, "required": [], "additionalProperties": False}
+
+
+def openai_client(model: str, **kwargs):
+    return _get_ChatOpenAI()(api_key="sk-test", model=model, **kwargs)
+
+
+class TestWithJsonSchema(unittest.TestCase):
+    def test_binds_schema_for_structured_output_models(self):
+        llm = with_json_schema(openai_client("gpt-4o-mini"), "unified_sql", SCHEMA)
+        self.assertEqual(llm.kwargs["response_format"]["json_schema"]["name"], "unified_sql")
+
+    def test_no_schema_for_o1_mini(self):
+        client = openai_client("o1-mini")
+        self.assertIs(with_json_schema(client, "unified_sql", SCHEMA), client)
+
+        # Also through an earlier binding, as in SQLAgent.unified_sql
+        llm = with_json_schema(with_prompt_cache_key(client, "key"), "unified_sql", SCHEMA)
+        self.assertNotIn("response_format", llm.kwargs)
+
+
+class TestCacheKey(unittest.TestCase):
+    def test_includes_model_parameters(self):
+        key = _cache_key(openai_client("gpt-4o-mini", temperature=0.0), "hi")
+        self.assertEqual(key, _cache_key(openai_client("gpt-4o-mini", temperature=0.0), "hi"))
+        self.assertNotEqual(key, _cache_key(openai_client("gpt-4o-mini", temperature=0.2), "hi"))
+        self.assertNotEqual(key, _cache_key(openai_client("gpt-4o", temperature=0.0), "hi"))
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_keys_on_the_exact_prompt(self):
+        self.assertNotEqual(ResponseCache.make_key("m", "a  b"), ResponseCache.make_key("m", "a b"))
+        self.assertNotEqual(
+            ResponseCache.make_key("m", [{"role": "user", "content": "a\nuser: b"}]),
+            ResponseCache.make_key("m", [{"role": "user", "content": "a"}, {"role": "user", "content": "b"}]))
+
+    def test_invoke_stores_each_response_once(self):
+        cache = ResponseCache()
+        model = FakeListChatModel(responses=["first", "second"], cache=cache)
+        with patch.object(LLM, "get_model", return_value=model):
+            self.assertEqual(LLM().invoke("hi", "gpt-4o-mini").content, "first")
+            self.assertEqual(LLM().invoke("hi", "gpt-4o-mini").content, "first")
+        self.assertEqual(len(cache._entries), 1)
+
+    def test_astream_does_not_read_langchain_generations(self):
+        model = FakeListChatModel(responses=["invoked", "streamed"], cache=response_cache)
+        prompt = [HumanMessage(content="hi")]
+        response_cache.clear()
+        with patch.object(LLM, "get_model", return_value=model):
+            self.assertEqual(LLM().invoke(prompt, "gpt-4o-mini").content, "invoked")
+
+            async def stream():
+                return "".join([chunk async for chunk in LLM().astream(prompt, "gpt-4o-mini")])
+            # The cached generations aren't mistaken for a streamed message
+            self.assertEqual(asyncio.run(stream()), "streamed")
+            self.assertEqual(asyncio.run(stream()), "streamed")
+        response_cache.clear()
+
+
+class FakeTransport(httpx.AsyncBaseTransport):
+    def __init__(self):
+        self.closed = False
+
+    async def handle_async_request(self, request):
+        return httpx.Response(200)
+
+    async def aclose(self):
+        self.closed = True
+
+
+class TestLoopLocalTransport(unittest.TestCase):
+    def test_closes_pools_of_closed_loops(self):
+        created = []
+        transport = LoopLocalTransport(lambda: created.append(FakeTransport()) or created[-1])
+        request = httpx.Request("GET", "http://test")
+        asyncio.run(transport.handle_async_request(request))
+        asyncio.run(transport.handle_async_request(request))
+        self.assertEqual([pool.closed for pool in created], [True, False])
+
+        async def use_and_close():
+            await transport.handle_async_request(request)
+            await transport.aclose()
+        asyncio.run(use_and_close())
+        self.assertTrue(all(pool.closed for pool in created))
+
+
+class TestGetModel(unittest.TestCase):
+    def setUp(self):
+        llm_config._resolved_models.clear()
+
+    def test_caches_the_requested_model(self):
+        with patch.object(LLM, "_load_model", return_value=openai_client("gpt-4o")) as load:
+            LLM().get_model("gpt-4o")
+            LLM().get_model("gpt-4o")
+        self.assertEqual(load.call_count, 1)
+
+    def test_does_not_cache_fallbacks(self):
+        with patch.object(LLM, "_load_model", return_value=openai_client("gpt-4o-mini")) as load:
+            LLM().get_model("gpt-4o")
+            LLM().get_model("gpt-4o")
+        self.assertEqual(load.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
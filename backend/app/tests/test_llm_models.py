@@ -11,18 +11,47 @@ Usage:
     python -m app.tests.test_llm_models
 """
 
+import asyncio
 import sys
 import os
-from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, List, Optional, Tuple
+import pytest
 from app.config.llm_config import (
     LLM,
     AVAILABLE_MODELS,
     DEFAULT_MODELS,
     get_available_models,
+    get_models_by_platform,
     validate_model,
     get_model_info
 )
 from app.config.env import OPENAI_API_KEY, GROQ_API_KEY
+from app.tests.live import should_run_live
+
+
+# Model metadata grouped by platform once per process, so repeated or
+# parametrized checks don't regroup the model list
+_MODEL_INFO: Dict[str, Dict] = {model['name']: model for model in get_available_models()}
+_MODELS_BY_PLATFORM: Dict[str, FrozenSet[str]] = {
+    platform: frozenset(name for name, model in _MODEL_INFO.items() if model['platform'] == platform)
+    for platform in {model['platform'] for model in _MODEL_INFO.values()}
+}
+
+
+@pytest.fixture(scope="session")
+def models_by_platform() -> Dict[str, FrozenSet[str]]:
+    return _MODELS_BY_PLATFORM
+
+
+@pytest.fixture(scope="session")
+def openai_available() -> bool:
+    return bool(OPENAI_API_KEY)
+
+
+@pytest.fixture(scope="session")
+def groq_available() -> bool:
+    return bool(GROQ_API_KEY)
 
 
 def print_header(text: str):
@@ -76,34 +105,67 @@ def test_model_definitions():
     """Test that all model definitions are valid"""
     print_header("Testing Model Definitions")
 
-    models = get_available_models()
-    print(f"Total models defined: {len(models)}\n")
-
-    # Group by platform
-    platforms = {}
-    for model in models:
-        platform = model['platform']
-        if platform not in platforms:
-            platforms[platform] = []
-        platforms[platform].append(model)
+    print(f"Total models defined: {len(_MODEL_INFO)}\n")
+    assert sum(len(names) for names in _MODELS_BY_PLATFORM.values()) == len(_MODEL_INFO)
 
     # Print models by platform
-    for platform, platform_models in platforms.items():
-        print(f"\n{platform.upper()} Models ({len(platform_models)}):")
-        for model in platform_models:
+    for platform, model_names in _MODELS_BY_PLATFORM.items():
+        print(f"\n{platform.upper()} Models ({len(model_names)}):")
+        for model in (_MODEL_INFO[name] for name in sorted(model_names)):
             print(f"  • {model['display_name']} ({model['name']})")
             print(f"    └─ {model['description']}")
             print(f"    └─ Capability: {model['capability']}")
             if model['best_for']:
                 print(f"    └─ Best for: {', '.join(model['best_for'][:2])}")
 
-    print_success(f"\nAll {len(models)} models defined correctly")
+    print_success(f"\nAll {len(_MODEL_INFO)} models defined correctly")
+
+
+def test_models_by_platform(models_by_platform: Dict[str, FrozenSet[str]]):
+    """Test that get_models_by_platform agrees with the model definitions"""
+    for platform, model_names in models_by_platform.items():
+        assert frozenset(get_models_by_platform(platform)) == model_names
+    assert get_models_by_platform("invalid-platform") == []
+
+
+def _try_init(llm: LLM, model_name: str) -> Tuple[str, bool, Optional[str]]:
+    try:
+        llm.get_model(model_name, fallback=False)
+        return model_name, True, None
+    except Exception as e:
+        return model_name, False, str(e)
+
+
+async def _prompt_all(llm: LLM, model_names: List[str], prompt: str) -> List[Tuple[str, bool, str]]:
+    """Send the prompt to every model at once, keeping per-model pass/fail."""
+    models = {}
+    results = {}
+    for model_name in model_names:
+        try:
+            models[model_name] = llm.get_model(model_name, fallback=False)
+        except Exception as e:
+            results[model_name] = (model_name, False, str(e))
+
+    responses = await asyncio.gather(
+        *(model.ainvoke(prompt) for model in models.values()), return_exceptions=True)
+    for model_name, response in zip(models, responses):
+        if isinstance(response, BaseException):
+            results[model_name] = (model_name, False, str(response))
+        else:
+            # Extract response content
+            response_text = response.content if hasattr(response, 'content') else str(response)
+            results[model_name] = (model_name, True, response_text)
+
+    return [results[model_name] for model_name in model_names]
 
 
 def test_model_initialization(openai_available: bool, groq_available: bool):
     """
     Test initializing each model.
 
+    Models are initialized concurrently; LLM is stateless so one instance is
+    shared by all worker threads.
+
     Args:
         openai_available: Whether OpenAI API key is available
         groq_available: Whether Groq API key is available
@@ -111,10 +173,10 @@ def test_model_initialization(openai_available: bool, groq_available: bool):
     print_header("Testing Model Initialization")
 
     llm = LLM()
-    results = []
+    model_names = []
 
     for model_name, config in AVAILABLE_MODELS.items():
-        platform = config.platform.value
+        platform = config.platform
 
         # Skip if API key not available
         if platform == "openai" and not openai_available:
@@ -127,14 +189,17 @@ def test_model_initialization(openai_available: bool, groq_available: bool):
             print_warning(f"Skipping {model_name} (Ollama testing not implemented)")
             continue
 
-        # Try to initialize the model
-        try:
-            model = llm.get_model(model_name, fallback=False)
+        model_names.append(model_name)
+
+    # Try to initialize the models
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda name: _try_init(llm, name), model_names))
+
+    for model_name, success, error in results:
+        if success:
             print_success(f"{model_name}: Initialized successfully")
-            results.append((model_name, True, None))
-        except Exception as e:
-            print_error(f"{model_name}: Failed to initialize - {str(e)}")
-            results.append((model_name, False, str(e)))
+        else:
+            print_error(f"{model_name}: Failed to initialize - {error}")
 
     # Print summary
     success_count = sum(1 for _, success, _ in results if success)
@@ -145,6 +210,7 @@ def test_model_initialization(openai_available: bool, groq_available: bool):
     print(f"{'='*80}")
 
 
+@pytest.mark.skipif(os.environ.get("RUN_LIVE_TESTS", "0") != "1", reason="Set RUN_LIVE_TESTS=1 to run live API tests")
 def test_simple_prompts(openai_available: bool, groq_available: bool):
     """
     Test each model with a simple prompt.
@@ -157,7 +223,6 @@ def test_simple_prompts(openai_available: bool, groq_available: bool):
 
     test_prompt = "What is 2+2? Answer with just the number."
     llm = LLM()
-    results = []
 
     # Test a few key models
     test_models = []
@@ -168,24 +233,14 @@ def test_simple_prompts(openai_available: bool, groq_available: bool):
 
     print(f"Testing {len(test_models)} models with prompt: '{test_prompt}'\n")
 
-    for model_name in test_models:
-        try:
-            model = llm.get_model(model_name, fallback=False)
-            response = model.invoke(test_prompt)
-
-            # Extract response content
-            if hasattr(response, 'content'):
-                response_text = response.content
-            else:
-                response_text = str(response)
+    results = asyncio.run(_prompt_all(llm, test_models, test_prompt))
 
+    for model_name, success, response_text in results:
+        if success:
             print_success(f"{model_name}:")
             print(f"  Response: {response_text[:100]}")
-            results.append((model_name, True, response_text))
-
-        except Exception as e:
-            print_error(f"{model_name}: {str(e)}")
-            results.append((model_name, False, str(e)))
+        else:
+            print_error(f"{model_name}: {response_text}")
 
     # Print summary
     success_count = sum(1 for _, success, _ in results if success)
@@ -206,7 +261,7 @@ def test_fallback_mechanism():
     print("Testing with invalid model name 'invalid-model-xyz'...")
     try:
         model = llm.get_model("invalid-model-xyz", fallback=True)
-        print_success(f"Fallback worked! Fell back to: {llm.current_model}")
+        print_success(f"Fallback worked! Fell back to: {model.model_name}")
     except Exception as e:
         print_error(f"Fallback failed: {str(e)}")
 
@@ -282,8 +337,7 @@ def main():
 
         # Test 7: Simple Prompts (optional, can be slow)
         print("\n" + "=" * 80)
-        response = input("Run live model tests with API calls? (y/N): ")
-        if response.lower() == 'y':
+        if should_run_live("Run live model tests with API calls? (y/N): "):
             test_simple_prompts(openai_available, groq_available)
         else:
             print("Skipping live API tests")
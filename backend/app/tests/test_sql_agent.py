@@ -1,9 +1,47 @@
+import asyncio
+import json
 import unittest
-from unittest.mock import patch, MagicMock
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import inspect
-from app.config.db_config import DB
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from app.langgraph.agents.sql_agent import SQLAgent
+
+
+SCHEMA = [
+    {"table_name": "sales", "schema": [{"name": "product_name", "type": "VARCHAR(100)"},
+                                       {"name": "quantity", "type": "INTEGER"}]},
+    {"table_name": "customers", "schema": [{"name": "name", "type": "TEXT"}]},
+]
+
+
+class RecordingChatModel(FakeListChatModel):
+    prompts: list = []
+
+    def _call(self, messages, *args, **kwargs):
+        self.prompts.append("\n".join(str(message.content) for message in messages))
+        return super()._call(messages, *args, **kwargs)
 
 
 class TestSQLAgent(unittest.TestCase):
-    pass
+    def _unified_sql(self, *responses):
+        llm = RecordingChatModel(responses=[json.dumps(response) for response in responses], prompts=[])
+        agent = SQLAgent(llm)
+        return asyncio.run(agent.unified_sql({"schema": SCHEMA, "question": "How many sales per product?"})), llm
+
+    def test_unified_sql_sends_full_schema(self):
+        unified = {"is_relevant": True, "relevant_tables": ["sales"],
+                   "sql_query": "SELECT `quantity` FROM `sales`", "validation": {"valid": True, "issues": None}}
+        state, llm = self._unified_sql(unified)
+        self.assertTrue(state["sql_valid"])
+        # Only the fused call was made, and it saw every table
+        self.assertEqual(len(llm.prompts), 1)
+        self.assertIn("customers", llm.prompts[0])
+
+    def test_unified_sql_fixes_locally_invalid_query(self):
+        unified = {"is_relevant": True, "relevant_tables": ["sales"],
+                   "sql_query": "SELECT `price` FROM `sales`", "validation": {"valid": True, "issues": None}}
+        fix = {"valid": False, "issues": "Unknown column price",
+               "corrected_query": "SELECT `quantity` FROM `sales`"}
+        state, llm = self._unified_sql(unified, fix)
+        self.assertEqual(len(llm.prompts), 2)
+        self.assertFalse(state["sql_valid"])
+        self.assertEqual(state["sql_query"], "SELECT `quantity` FROM `sales`")
+        self.assertEqual(state["sql_issues"], "Unknown column price")
@@ -0,0 +1,156 @@
+import unittest
+from app.utils.sql_utils import add_missing_value_filters, filter_schema, is_valid_sql, match_schema_insights
+
+
+SCHEMA = [{
+    "table_name": "sales",
+    "schema": [
+        {"name": "product_name", "type": "VARCHAR(100)", "nullable": True},
+        {"name": "quantity", "type": "INTEGER", "nullable": True},
+    ]
+}]
+
+
+class TestAddMissingValueFilters(unittest.TestCase):
+    def test_filters_projected_columns(self):
+        sql = add_missing_value_filters(
+            "SELECT `product_name`, SUM(`quantity`) AS `total` FROM `sales` GROUP BY `product_name`", SCHEMA)
+        self.assertIn("NOT `product_name` IS NULL", sql)
+        self.assertIn("NOT `product_name` IN ('', 'N/A')", sql)
+        # Aggregated columns are left alone
+        self.assertNotIn("`quantity` IS NULL", sql)
+
+    def test_non_text_columns_only_filter_nulls(self):
+        sql = add_missing_value_filters("SELECT `quantity` FROM `sales`", SCHEMA)
+        self.assertIn("NOT `quantity` IS NULL", sql)
+        self.assertNotIn("'N/A'", sql)
+
+    def test_keeps_existing_where(self):
+        sql = add_missing_value_filters(
+            "SELECT `product_name` FROM `sales` WHERE `quantity` > 1 OR `quantity` < 0", SCHEMA)
+        self.assertIn("(`quantity` > 1 OR `quantity` < 0) AND", sql)
+
+    def test_keeps_postgres_operators(self):
+        sql = add_missing_value_filters(
+            "SELECT `product_name` || ' x' || `quantity` AS `label` FROM `sales`", SCHEMA)
+        self.assertIn("`product_name` || ' x' || `quantity`", sql)
+        self.assertNotIn(" OR ", sql)
+
+    def test_double_quoted_identifiers(self):
+        sql = add_missing_value_filters('SELECT "product_name" FROM "sales" WHERE "quantity" > 1', SCHEMA)
+        self.assertIn('"quantity" > 1', sql)
+        self.assertIn('NOT "product_name" IS NULL', sql)
+
+    def test_skips_columns_already_in_where(self):
+        sql = "SELECT `product_name`, `quantity` FROM `sales` WHERE `product_name` IS NULL"
+        filtered = add_missing_value_filters(sql, SCHEMA)
+        self.assertNotIn("NOT `product_name` IS NULL", filtered)
+        self.assertIn("NOT `quantity` IS NULL", filtered)
+
+    def test_resolves_column_type_per_table(self):
+        schema = [
+            {"table_name": "users", "schema": [{"name": "email", "type": "TEXT"}, {"name": "id", "type": "INTEGER"}]},
+            {"table_name": "orders", "schema": [{"name": "email", "type": "INTEGER"},
+                                                {"name": "user_id", "type": "INTEGER"}]},
+        ]
+        sql = add_missing_value_filters("SELECT `email` FROM `orders`", schema)
+        self.assertIn("NOT `email` IS NULL", sql)
+        self.assertNotIn("'N/A'", sql)
+
+        sql = add_missing_value_filters("SELECT `u`.`email` FROM `users` AS `u`", schema)
+        self.assertIn("NOT `u`.`email` IN ('', 'N/A')", sql)
+
+        # Ambiguous across joined tables: only the NULL filter
+        sql = add_missing_value_filters(
+            "SELECT `email` FROM `users` JOIN `orders` ON `users`.`id` = `orders`.`user_id`", schema)
+        self.assertIn("NOT `email` IS NULL", sql)
+        self.assertNotIn("'N/A'", sql)
+
+    def test_lowercase_keywords_and_compact_joins(self):
+        sql = add_missing_value_filters("select `product_name` from `sales`;", SCHEMA)
+        self.assertIn("NOT `product_name` IN ('', 'N/A')", sql)
+
+        schema = SCHEMA + [{"table_name": "products", "schema": [{"name": "name", "type": "TEXT"}]}]
+        sql = add_missing_value_filters(
+            "select `p`.`name` from `sales` `s` join `products` `p` on `p`.`name`=`s`.`product_name`", schema)
+        self.assertIn("NOT `p`.`name` IN ('', 'N/A')", sql)
+
+    def test_unchanged_when_not_reproducible(self):
+        for sql in ("SELECT `quantity` FROM `sales` WHERE `sale_date` > now() - INTERVAL '30 days'",
+                    "SELECT `quantity` FROM `sales` WHERE `product_name`::int > 1"):
+            self.assertEqual(add_missing_value_filters(sql, SCHEMA), sql)
+
+    def test_unchanged_without_plain_columns(self):
+        for sql in ("SELECT COUNT(*) FROM `sales`", "SELECT * FROM `sales`", "NOT_RELEVANT (((",
+                    "SELECT `product_name FROM `sales`"):
+            self.assertEqual(add_missing_value_filters(sql, SCHEMA), sql)
+
+
+class TestIsValidSql(unittest.TestCase):
+    def test_known_identifiers(self):
+        self.assertTrue(is_valid_sql(
+            "SELECT `product_name`, SUM(`quantity`) AS `total` FROM `sales` "
+            "GROUP BY `product_name` ORDER BY `total` DESC", SCHEMA))
+
+    def test_unknown_identifiers(self):
+        self.assertFalse(is_valid_sql("SELECT `price` FROM `sales`", SCHEMA))
+        self.assertFalse(is_valid_sql("SELECT `quantity` FROM `orders`", SCHEMA))
+
+    def test_unparseable(self):
+        self.assertFalse(is_valid_sql("NOT_RELEVANT", SCHEMA))
+        self.assertFalse(is_valid_sql("SELECT FROM WHERE (((", SCHEMA))
+        self.assertFalse(is_valid_sql("SELECT `product_name FROM `sales`", SCHEMA))
+
+
+class TestFilterSchema(unittest.TestCase):
+    def test_keeps_relevant_tables(self):
+        schema = SCHEMA + [{"table_name": "users", "schema": []}]
+        self.assertEqual(filter_schema(schema, ["Sales"]), SCHEMA)
+
+    def test_falls_back_to_full_schema(self):
+        self.assertEqual(filter_schema(SCHEMA, ["orders"]), SCHEMA)
+        self.assertEqual(filter_schema(SCHEMA, []), SCHEMA)
+
+
+class TestMatchSchemaInsights(unittest.TestCase):
+    def test_named_table(self):
+        parsed = match_schema_insights("How many sales per product?", SCHEMA)
+        self.assertEqual(parsed["relevant_tables"][0]["table_name"], "sales")
+        self.assertEqual(parsed["relevant_tables"][0]["noun_columns"], ["product_name"])
+
+    def test_upload_suffix_is_ignored(self):
+        schema = [{"table_name": "vantc001_a0634235", "schema": []}]
+        parsed = match_schema_insights("Show VanTC001 rows", schema)
+        self.assertEqual(parsed["relevant_tables"][0]["table_name"], "vantc001_a0634235")
+
+    def test_defers_to_llm(self):
+        self.assertIsNone(match_schema_insights("What is the top product?", SCHEMA))
+        self.assertIsNone(match_schema_insights("Summarize the sales data", SCHEMA))
+
+    def test_partial_words_do_not_match(self):
+        schema = [{"table_name": "orders", "schema": []}, {"table_name": "order_items", "schema": []}]
+        for question in ("Sort customers by order date", "Which salesperson sold most?", "List the orderly ones"):
+            self.assertIsNone(match_schema_insights(question, schema + SCHEMA), question)
+        parsed = match_schema_insights("How many order items per product?", schema)
+        self.assertEqual([table["table_name"] for table in parsed["relevant_tables"]], ["order_items"])
+
+    def test_ambiguous_names_defer_to_llm(self):
+        schema = [{"table_name": "sales_a0634235", "schema": []}, {"table_name": "sales_b1745346", "schema": []}]
+        self.assertIsNone(match_schema_insights("Total sales per month", schema))
+        schema = [{"table_name": "order_items", "schema": []}, {"table_name": "items", "schema": []}]
+        self.assertIsNone(match_schema_insights("Count order items", schema))
+
+    def test_noun_columns(self):
+        schema = [{"table_name": "sales", "schema": [
+            {"name": "customer_id", "type": "TEXT"},
+            {"name": "region", "type": "TEXT"},
+            {"name": "description", "type": "TEXT"},
+            {"name": "sold_at", "type": "TIMESTAMP"},
+            {"name": "price", "type": "DOUBLE PRECISION"},
+        ]}]
+        parsed = match_schema_insights("Top sales by region", schema)
+        self.assertEqual(parsed["relevant_tables"][0]["noun_columns"], ["region"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,20 +1,63 @@
-from app.langgraph.workflows.sql_workflow import WorkflowManager
 from app.config.llm_config import LLM
-from app.config.db_config import DB, VectorDB
-from fastapi.responses import StreamingResponse, JSONResponse
-from langchain_core.prompts import PromptTemplate
-from typing import List, Optional
+from app.utils.llm_utils import model_id
+from app.config.db_config import DB
+from fastapi.responses import StreamingResponse
+from typing import Dict, List, Optional, Tuple
 from app.config.logging_config import get_logger
-from app.api.db.chat_history import Messages, Conversations
-from datetime import datetime
-from sqlalchemy import JSON
+from app.api.db.chat_history import Messages
+from sqlalchemy import JSON, bindparam, insert, select
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException
-import json
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
+from functools import lru_cache
+from contextlib import aclosing
+from collections import OrderedDict
+from threading import Lock
+import orjson
+import re
+import time
 
 logger = get_logger(__name__)
-llm_instance = LLM()
-vectorDB_instance = VectorDB()
+
+
+# Keywords that explicitly request natural language explanation/summary
+# These should NEVER trigger SQL analysis
+EXPLANATION_KEYWORDS = (
+    'explain', 'describe', 'what is', 'tell me about',
+    'summarize', 'summary', 'overview', 'understand',
+    'clarify', 'elaborate', 'provide details', 'logic',
+    'how does', 'what does', 'meaning of'
+)
+
+# Keywords that REQUIRE SQL/database query
+SQL_REQUIRED_KEYWORDS = (
+    'how many', 'count', 'sum', 'average', 'mean',
+    'show all', 'list all', 'find records where', 'search for',
+    'maximum', 'minimum', 'median', 'total',
+    'group by', 'order by', 'sort by',
+    'top ', 'bottom ', 'highest', 'lowest',
+    'greater than', 'less than', 'between',
+    'statistics', 'distribution', 'frequency',
+    'chart', 'graph', 'visualization', 'plot',
+    'filter by', 'where ', 'calculate'
+)
+
+
+def _keyword_pattern(keywords) -> "re.Pattern":
+    """
+    Compile a keyword list into one alternation, so each check is a single scan.
+
+    Keywords must start at a word boundary ("count" doesn't fire on "account",
+    "sum" doesn't fire on "consumer") but may be followed by a suffix, so
+    "summarized" and "totals" still match.
+    """
+    return re.compile(r"\b(?:" + "|".join(map(re.escape, keywords)) + ")")
+
+
+_EXPLANATION_RE = _keyword_pattern(EXPLANATION_KEYWORDS)
+_SQL_REQUIRED_RE = _keyword_pattern(SQL_REQUIRED_KEYWORDS)
+_MIN_SQL_KEYWORD_LENGTH = min(map(len, SQL_REQUIRED_KEYWORDS))
 
 
 def should_use_data_analysis(question: str, has_uploaded_data: bool) -> bool:
@@ -33,47 +76,92 @@ def should_use_data_analysis(question: str, has_uploaded_data: bool) -> bool:
         logger.info("No uploaded data - using direct chat mode")
         return False
 
+    # Only questions with a SQL keyword can need the workflow, so questions too
+    # short to hold one (greetings, acknowledgements) are settled right away
+    if len(question) < _MIN_SQL_KEYWORD_LENGTH:
+        logger.info("Short query - using direct chat mode")
+        return False
+
     question_lower = question.lower()
 
-    # Keywords that explicitly request natural language explanation/summary
-    # These should NEVER trigger SQL analysis
-    explanation_keywords = [
-        'explain', 'describe', 'what is', 'tell me about',
-        'summarize', 'summary', 'overview', 'understand',
-        'clarify', 'elaborate', 'provide details', 'logic',
-        'how does', 'what does', 'meaning of'
-    ]
+    # Check if query explicitly needs data calculation/filtering; without
+    # SQL keywords the explanation check can't change the outcome
+    if not _SQL_REQUIRED_RE.search(question_lower):
+        # This gives more natural responses and users can be more specific if they need SQL
+        logger.info("No SQL keywords in query - using direct chat mode")
+        return False
 
     # If asking for explanation/summary, use direct chat (with data context if needed)
-    if any(keyword in question_lower for keyword in explanation_keywords):
-        logger.info(f"Explanation/summary request detected - using direct chat mode")
+    if _EXPLANATION_RE.search(question_lower):
+        logger.info("Explanation/summary request detected - using direct chat mode")
         return False
 
-    # Keywords that REQUIRE SQL/database query
-    sql_required_keywords = [
-        'how many', 'count', 'sum', 'average', 'mean',
-        'show all', 'list all', 'find records where', 'search for',
-        'maximum', 'minimum', 'median', 'total',
-        'group by', 'order by', 'sort by',
-        'top ', 'bottom ', 'highest', 'lowest',
-        'greater than', 'less than', 'between',
-        'statistics', 'distribution', 'frequency',
-        'chart', 'graph', 'visualization', 'plot',
-        'filter by', 'where ', 'calculate'
-    ]
+    logger.info("SQL query keywords detected - using SQL workflow")
+    return True
+
+
+def _frame(obj) -> bytes:
+    """Serialize one NDJSON stream frame; StreamingResponse sends bytes as-is."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+
 
-    # Check if query explicitly needs data calculation/filtering
-    if any(keyword in question_lower for keyword in sql_required_keywords):
-        logger.info(f"SQL query keywords detected - using SQL workflow")
-        return True
+# Streams are newline-delimited JSON, not SSE framing; the headers stop
+# proxies (nginx, load balancers) from buffering the frames
+STREAM_MEDIA_TYPE = "application/x-ndjson"
+STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
 
-    # Default: For ambiguous queries with uploaded data, use direct chat
-    # This gives more natural responses and users can be more specific if they need SQL
-    logger.info("Ambiguous query with uploaded data - using direct chat mode")
-    return False
 
+def _stream_response(frames, background: Optional[BackgroundTask] = None) -> StreamingResponse:
+    """Wrap an iterator of NDJSON frames in an unbuffered streaming response."""
+    return StreamingResponse(frames, media_type=STREAM_MEDIA_TYPE, headers=STREAM_HEADERS,
+                             background=background)
 
-def execute_workflow(question: str, conversation_id: int, table_list: List[str], llm_model: Optional[str] = "gpt-4o-mini", system_db: Optional[DB] = None, db_url: Optional[str] = None):
+
+def _save_answer(conversation_id: int, answer: dict, db: DB) -> None:
+    """
+    Save a streamed answer once the response has been sent.
+
+    Runs as the response's background task, so the client gets EOF right after
+    the last frame instead of waiting for the commit. `answer` is filled in by
+    the stream and stays empty if streaming failed, in which case nothing is
+    saved.
+    """
+    if not answer:
+        return
+    try:
+        save_message(conversation_id=conversation_id, role="assistant", content=answer, db=db)
+    except Exception as e:
+        # The response is already sent, so the failure can only be logged
+        logger.error("Error occurred while saving message: %s", e)
+
+
+# Workflow nodes whose LLM output is the user-facing answer and is streamed token by token
+STREAMED_NODES = {"format_results", "conversational_response"}
+
+
+@lru_cache(maxsize=32)
+def _get_db(db_url: str) -> DB:
+    """Reuse one DB (engine and connection pool) per URL across requests."""
+    logger.info("Creating new DB connection")
+    return DB(db_url)
+
+
+@lru_cache(maxsize=32)
+def _compiled_app(llm_instance: LLM, resolved_model: str, db: DB):
+    """
+    Build and compile the SQL workflow once per (model, database).
+
+    Keyed on the model actually resolved, not the one requested, so a
+    fallback substitution isn't pinned for the requested name. The graph
+    holds no per-question state (question and schema are passed as inputs to
+    astream), so the compiled app is shared by concurrent requests.
+    """
+    # Imported here so direct-chat-only workers don't load LangGraph and the SQL agent
+    from app.langgraph.workflows.sql_workflow import WorkflowManager
+    return WorkflowManager(llm_instance.get_model(resolved_model, fallback=False), db).create_workflow().compile()
+
+
+def execute_workflow(question: str, conversation_id: int, table_list: List[str], llm_instance: LLM, llm_model: Optional[str] = "gpt-4o-mini", system_db: Optional[DB] = None, db_url: Optional[str] = None):
 
     # Initialize db variable
     db: DB
@@ -85,147 +173,190 @@ def execute_workflow(question: str, conversation_id: int, table_list: List[str],
         db = system_db
     # Case 2: Use db_url if provided
     elif db_url is not None:
-        logger.info("Creating new SYSTEM DB connection")
-        db = DB(db_url)
+        logger.info("Using DB connection for the given URL")
+        db = _get_db(db_url)
     else:
         raise ValueError("Either system_db or db_url must be provided")
 
 
-    # Use the new centralized configuration with automatic fallback
-    llm = llm_instance.get_model(llm_model, fallback=True)
-    schema = db.get_schemas(table_names=table_list)
+    app = _compiled_app(llm_instance, model_id(llm_instance.get_model(llm_model, fallback=True)), db)
 
-    workflow = WorkflowManager(llm, db)
-    app = workflow.create_workflow().compile()
+    # Filled in by event_stream and saved after the response is sent
+    answer = {}
 
-    # Define a generator to stream the data from LangGraph
-    def event_stream():
+    # Define an async generator to stream the data from LangGraph; Starlette
+    # iterates it on the event loop instead of a threadpool
+    async def event_stream():
         ai_responses = []
         try:
-            for event in app.stream({"question": question, "schema": schema}):
-                for value in event.values():
-                    ai_responses.append(json.dumps(value))
-                    # Yield the streamed data as a JSON object
-                    yield json.dumps({"data": value}) + "\n"
-
-            # After streaming is complete, save all responses as one message
-            try:
-                save_message(
-                    conversation_id=conversation_id,
-                    role="assistant",
-                    content=json.dumps({"answer":ai_responses}),
-                    db=system_db
-                )
-            except SQLAlchemyError as e:
-                logger.error(
-                    f"Database error occurred while saving message: {str(e)}")
-                yield json.dumps({"error": str(e)}) + "\n"
-
-            except Exception as e:
-                logger.error(f"Error occurred while saving message: {str(e)}")
-                yield json.dumps({"error": str(e)}) + "\n"
+            # Schema misses hit the database catalog, so look them up off the event loop
+            schema = await run_in_threadpool(db.get_schemas, table_list)
+
+            # aclosing() shuts the graph run down as soon as the client disconnects
+            events = app.astream({"question": question, "schema": schema},
+                                 stream_mode=["updates", "messages"])
+            async with aclosing(events):
+                async for mode, event in events:
+                    if mode == "messages":
+                        # Forward answer tokens as they are generated
+                        chunk, metadata = event
+                        if metadata.get("langgraph_node") in STREAMED_NODES and chunk.content:
+                            yield _frame({"data": {"delta": chunk.content}})
+                        continue
+
+                    for value in event.values():
+                        ai_responses.append(value)
+                        # Yield the streamed data as a JSON object
+                        yield _frame({"data": value})
+            yield _frame({"done": True})
+
+            # Save all responses as one message
+            answer["answer"] = ai_responses
 
         except Exception as e:
-            logger.error(f"Error occurred during streaming: {str(e)}")
-            yield json.dumps({"error": str(e)}) + "\n"
-        finally:
-            # Clean up resources
-            if app.stream and hasattr(app.stream, 'close'):
-                try:
-                    app.stream.close()
-                except Exception as e:
-                    yield json.dumps({"error": str(e)}) + "\n"
-                    logger.error(f"Error closing stream: {str(e)}")
+            logger.error("Error occurred during streaming: %s", e)
+            yield _frame({"error": str(e)})
     # Return the streaming response using event_stream generator
-    return StreamingResponse(event_stream(), media_type="text/event-stream")
+    return _stream_response(event_stream(), BackgroundTask(_save_answer, conversation_id, answer, system_db))
 
 
-def execute_direct_chat(question: str, conversation_id: int, llm_model: Optional[str] = "gpt-4o-mini", system_db: Optional[DB] = None, data_source_info: Optional[dict] = None):
+def _load_object(text: str) -> Optional[dict]:
+    """Parse text holding a JSON object; anything else is returned as None without raising."""
+    if not text.startswith("{"):
+        return None
+    try:
+        parsed = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return None
+    return parsed if type(parsed) is dict else None
+
+
+def _extract_answer(answer) -> Optional[str]:
+    """Pull the answer text out of a saved assistant message's "answer" field."""
+    if type(answer) is not list:
+        return str(answer)
+    # Workflow messages store every step; older ones as JSON strings
+    for step in reversed(answer):
+        if type(step) is str:
+            step = _load_object(step)
+        if type(step) is dict and step.get('answer'):
+            return step['answer']
+    return None
+
+
+# Saved message content key -> (role, text) for the LLM history
+_HISTORY_FIELDS = {
+    "question": lambda content: ("user", content["question"]),
+    "answer": lambda content: ("assistant", _extract_answer(content["answer"])),
+}
+
+
+def _history_entry(role: str, content) -> Optional[dict]:
+    """Convert a saved message into a role/content dict for the LLM, if it has text."""
+    if type(content) is str:
+        parsed = _load_object(content)
+        if parsed is None:
+            return {"role": role, "content": content}
+        content = parsed
+    if type(content) is not dict:
+        return {"role": role, "content": str(content)}
+
+    for field, extract in _HISTORY_FIELDS.items():
+        if field in content:
+            role, text = extract(content)
+            return {"role": role, "content": text} if text else None
+    # Plain content
+    return {"role": role, "content": str(content)}
+
+
+# Number of past messages sent to the LLM as context
+HISTORY_LENGTH = 10
+HISTORY_CACHE_TTL = 600
+HISTORY_CACHE_MAXSIZE = 10_000
+# conversation_id -> ({message id: LLM entry, None if skipped}, expiry) for the latest messages
+_history_cache: "OrderedDict[int, Tuple[Dict[int, Optional[dict]], float]]" = OrderedDict()
+_history_cache_lock = Lock()
+
+# Statements are built once so each call only binds parameters and hits
+# SQLAlchemy's compiled cache without rebuilding the statement and its cache key.
+# Newest first so the LIMIT reads the end of the conversation; one extra id
+# leaves room for an excluded message
+_HISTORY_IDS_QUERY = (
+    select(Messages.id)
+    .where(Messages.conversation_id == bindparam("conversation_id"))
+    .order_by(Messages.id.desc())
+    .limit(HISTORY_LENGTH + 1)
+)
+_HISTORY_ROWS_QUERY = (
+    select(Messages.id, Messages.role, Messages.content)
+    .where(Messages.id.in_(bindparam("ids", expanding=True)))
+)
+_INSERT_MESSAGE = insert(Messages).returning(Messages.id, Messages.role, sort_by_parameter_order=True)
+
+
+def _cache_history(conversation_id: int, entries: Dict[int, Optional[dict]], replace: bool = True) -> None:
+    """Store converted messages, keeping only the newest HISTORY_LENGTH + 1 per conversation."""
+    with _history_cache_lock:
+        cached = _history_cache.get(conversation_id)
+        if not replace:
+            if cached is None:
+                return
+            entries = {**cached[0], **entries}
+        if len(entries) > HISTORY_LENGTH + 1:
+            entries = {message_id: entries[message_id] for message_id in sorted(entries)[-(HISTORY_LENGTH + 1):]}
+        _history_cache[conversation_id] = (entries, time.monotonic() + HISTORY_CACHE_TTL)
+        _history_cache.move_to_end(conversation_id)
+        while len(_history_cache) > HISTORY_CACHE_MAXSIZE:
+            _history_cache.popitem(last=False)
+
+
+def _conversation_history(system_db: DB, conversation_id: int, exclude_id: Optional[int] = None) -> List[dict]:
     """
-    Execute direct ChatGPT-style response without SQL queries.
-    Can include data context for summaries and explanations.
+    Return the last HISTORY_LENGTH messages of a conversation as LLM messages.
+
+    The ids of the latest messages are read every time, so messages written
+    by other workers are picked up whatever order they committed in. Only
+    messages that weren't converted before (here or by save_messages) are
+    fetched and parsed.
 
     Args:
-        question: The user's question
-        conversation_id: ID of the conversation for history tracking
-        llm_model: Model name to use (default: gpt-4o-mini)
-        system_db: Database instance for saving messages
-        data_source_info: Optional dict with data source context (table_name, sample_data, etc.)
+        system_db: Database the messages are saved in
+        conversation_id: ID of the conversation
+        exclude_id: Message left out of the history, e.g. the question being answered
 
     Returns:
-        StreamingResponse with ChatGPT response
+        Role/content dicts in chronological order
     """
-    try:
-        # Get the LLM model
-        llm = llm_instance.get_model(llm_model, fallback=True)
-        logger.info(f"Using direct chat mode with model: {llm_model}")
+    with _history_cache_lock:
+        cached = _history_cache.get(conversation_id)
+        known = dict(cached[0]) if cached is not None and cached[1] >= time.monotonic() else {}
 
-        # Fetch conversation history for context
-        conversation_history = []
-        if system_db and conversation_id:
-            try:
-                with system_db.session() as session:
-                    query = (
-                        select(Messages.role, Messages.content)
-                        .where(Messages.conversation_id == conversation_id)
-                        .order_by(Messages.created_at.asc())
-                        .limit(10)  # Last 10 messages for context
-                    )
-                    results = session.execute(query).all()
-
-                    for role, content in results:
-                        if isinstance(content, dict):
-                            # Extract question or answer from content
-                            if 'question' in content:
-                                conversation_history.append({
-                                    "role": "user",
-                                    "content": content['question']
-                                })
-                            elif 'answer' in content:
-                                # Try to get the last answer if it's a list
-                                answer = content['answer']
-                                if isinstance(answer, list) and len(answer) > 0:
-                                    # Get the last item and extract text if it's JSON
-                                    last_answer = answer[-1]
-                                    if isinstance(last_answer, str):
-                                        try:
-                                            parsed = json.loads(last_answer)
-                                            if 'answer' in parsed:
-                                                conversation_history.append({
-                                                    "role": "assistant",
-                                                    "content": parsed['answer']
-                                                })
-                                        except:
-                                            pass
-                                else:
-                                    conversation_history.append({
-                                        "role": "assistant",
-                                        "content": str(answer)
-                                    })
-                            else:
-                                # Plain content
-                                conversation_history.append({
-                                    "role": role,
-                                    "content": str(content)
-                                })
-                        elif isinstance(content, str):
-                            conversation_history.append({
-                                "role": role,
-                                "content": content
-                            })
-            except Exception as e:
-                logger.warning(f"Could not fetch conversation history: {str(e)}")
+    with system_db.session() as session:
+        recent = session.scalars(_HISTORY_IDS_QUERY, {"conversation_id": conversation_id}).all()
+        missing = [message_id for message_id in recent if message_id not in known]
+        if missing:
+            for message_id, role, content in session.execute(_HISTORY_ROWS_QUERY, {"ids": missing}):
+                known[message_id] = _history_entry(role, content)
+
+    _cache_history(conversation_id, {message_id: known.get(message_id) for message_id in recent})
+    # Restore chronological order; skipped messages are None
+    ids = [message_id for message_id in recent if message_id != exclude_id][:HISTORY_LENGTH]
+    return [known[message_id] for message_id in reversed(ids) if known.get(message_id) is not None]
 
-        # Build messages for the LLM
-        # If data source info is provided, create a data-aware system prompt
-        if data_source_info:
-            system_content = f"""You are an expert data analyst assistant. The user has uploaded a dataset and wants to understand it.
+
+# System prompts for direct chat, built once instead of on every request
+DIRECT_CHAT_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a helpful AI assistant. Provide clear, comprehensive, and well-structured responses using markdown formatting. Be concise but thorough."
+}
+
+DATA_CHAT_SYSTEM_PROMPT = """You are an expert data analyst assistant. The user has uploaded a dataset and wants to understand it.
 
 Dataset Information:
-- File/Source: {data_source_info.get('name', 'Unknown')}
-- Table: {data_source_info.get('table_name', 'N/A')}
+- File/Source: {name}
+- Table: {table_name}
 
-{data_source_info.get('data_preview', '')}
+{data_preview}
 
 Provide clear, comprehensive explanations about the data. Use markdown formatting for better readability:
 - Use **bold** for emphasis
@@ -235,36 +366,65 @@ Provide clear, comprehensive explanations about the data. Use markdown formattin
 
 Focus on explaining WHAT the data represents and WHY it matters, not just technical details.
 Do NOT write SQL queries unless specifically asked. Provide natural language explanations."""
+
+
+def execute_direct_chat(question: str, conversation_id: int, llm_instance: LLM, llm_model: Optional[str] = "gpt-4o-mini", system_db: Optional[DB] = None, data_source_info: Optional[dict] = None, question_id: Optional[int] = None):
+    """
+    Execute direct ChatGPT-style response without SQL queries.
+    Can include data context for summaries and explanations.
+
+    Args:
+        question: The user's question
+        conversation_id: ID of the conversation for history tracking
+        llm_instance: Shared LLM router used to resolve the model
+        llm_model: Model name to use (default: gpt-4o-mini)
+        system_db: Database instance for saving messages
+        data_source_info: Optional dict with data source context (table_name, sample_data, etc.)
+        question_id: ID of the already saved question, left out of the history
+
+    Returns:
+        StreamingResponse with ChatGPT response
+    """
+    try:
+        logger.info("Using direct chat mode with model: %s", llm_model)
+
+        # Build messages for the LLM
+        # If data source info is provided, create a data-aware system prompt
+        if data_source_info:
+            system_message = {"role": "system", "content": DATA_CHAT_SYSTEM_PROMPT.format(
+                name=data_source_info.get('name', 'Unknown'),
+                table_name=data_source_info.get('table_name', 'N/A'),
+                data_preview=data_source_info.get('data_preview', ''),
+            )}
         else:
-            system_content = "You are a helpful AI assistant. Provide clear, comprehensive, and well-structured responses using markdown formatting. Be concise but thorough."
-
-        messages = [
-            {
-                "role": "system",
-                "content": system_content
-            }
-        ]
-
-        # Add conversation history
-        messages.extend(conversation_history)
-
-        # Add current question
-        messages.append({
-            "role": "user",
-            "content": question
-        })
+            system_message = DIRECT_CHAT_SYSTEM_MESSAGE
 
-        # Define a generator to stream the response
-        def event_stream():
-            try:
-                # Get response from LLM
-                response = llm.invoke(messages)
+        # The conversation history goes between these two
+        messages = [system_message, {"role": "user", "content": question}]
+
+        # Filled in by event_stream and saved after the response is sent
+        saved_answer = {}
 
-                # Extract content from response
-                if hasattr(response, 'content'):
-                    answer = response.content
-                else:
-                    answer = str(response)
+        # Define an async generator so tokens are forwarded as they are generated
+        async def event_stream():
+            try:
+                # Fetch conversation history for context off the event loop
+                if system_db and conversation_id:
+                    try:
+                        messages[1:1] = await run_in_threadpool(
+                            _conversation_history, system_db, conversation_id, question_id)
+                    except Exception as e:
+                        logger.warning("Could not fetch conversation history: %s", e)
+
+                # Stream partial answers, then send the full answer below
+                chunks = []
+                model_name = model_id(llm_instance.get_model(llm_model, fallback=True))
+                async with aclosing(llm_instance.astream(messages, model_name=model_name)) as stream:
+                    async for chunk in stream:
+                        if chunk:
+                            chunks.append(chunk)
+                            yield _frame({"data": {"delta": chunk, "mode": "direct_chat"}})
+                answer = "".join(chunks)
 
                 # Format response in same structure as workflow for frontend compatibility
                 result = {
@@ -274,42 +434,28 @@ Do NOT write SQL queries unless specifically asked. Provide natural language exp
                 }
 
                 # Yield the response
-                yield json.dumps({"data": result}) + "\n"
+                yield _frame({"data": result})
+                yield _frame({"done": True})
 
                 # Save the response to database
-                if system_db and conversation_id:
-                    try:
-                        save_message(
-                            conversation_id=conversation_id,
-                            role="assistant",
-                            content={"answer": answer, "mode": "direct_chat"},
-                            db=system_db
-                        )
-                    except SQLAlchemyError as e:
-                        logger.error(f"Database error while saving message: {str(e)}")
-                        yield json.dumps({"error": str(e)}) + "\n"
+                saved_answer.update({"answer": answer, "mode": "direct_chat"})
 
             except Exception as e:
-                logger.error(f"Error during direct chat: {str(e)}")
-                yield json.dumps({"error": str(e)}) + "\n"
+                logger.error("Error during direct chat: %s", e)
+                yield _frame({"error": str(e)})
 
-        return StreamingResponse(event_stream(), media_type="text/event-stream")
+        save = None
+        if system_db and conversation_id:
+            save = BackgroundTask(_save_answer, conversation_id, saved_answer, system_db)
+        return _stream_response(event_stream(), save)
 
     except Exception as e:
-        logger.error(f"Error initializing direct chat: {str(e)}")
+        logger.error("Error initializing direct chat: %s", e)
 
         def error_stream():
-            yield json.dumps({"error": str(e)}) + "\n"
-
-        return StreamingResponse(error_stream(), media_type="text/event-stream")
+            yield _frame({"error": str(e)})
 
-
-def serialize_document(doc):
-    """Helper function to serialize a Document object"""
-    return {
-        "page_content": doc.page_content,
-        "metadata": doc.metadata
-    }
+        return _stream_response(error_stream())
 
 
 # DISABLED: This function uses deprecated RetrievalQA which is not available
@@ -321,93 +467,52 @@ def execute_document_chat(question: str, embedding_model: str, table_name: str):
     """
     raise NotImplementedError("Document chat feature is currently disabled due to dependency issues")
 
-# ORIGINAL COMMENTED OUT CODE BELOW:
-#     try:
-#         # Initialize embedding
-#         vectorDB_instance.initialize_embedding(embedding_model)
-#
-#         # Get vector store
-#         vector_store = vectorDB_instance.get_vector_store(table_name)
-#
-#         # Initialize LLM
-#         llm = llm_instance.openai("gpt-4o-mini")
-#
-#         # Create a prompt template
-#         prompt_template = """You are Lumin, an advanced data analysis assistant, analyze the following context to answer the question. Follow these guidelines:
-#
-#         1. Use only the information provided in the context.
-#         2. If the context doesn't contain enough information, state that clearly.
-#         3. Provide data-driven insights when possible.
-#         4. Be concise but comprehensive in your response.
-#         5. If applicable, mention any trends, patterns, or anomalies in the data.
-#
-#         Context:
-#         {context}
-#
-#         Question: {question}
-#
-#         Analysis:
-#         """
-#
-#         PROMPT = PromptTemplate(
-#             template=prompt_template, input_variables=["context", "question"]
-#         )
-#
-#         # Create a RetrievalQA chain
-#         qa = RetrievalQA.from_chain_type(
-#             llm=llm,
-#             chain_type="stuff",
-#             retriever=vector_store.as_retriever(search_kwargs={"k": 2}),
-#             return_source_documents=True,
-#             chain_type_kwargs={"prompt": PROMPT}
-#         )
-#
-#         # Execute the chain
-#         result = qa({"query": question})
-#
-#         # Serialize the source documents
-#         serialized_docs = [serialize_document(
-#             doc) for doc in result.get('source_documents', [])]
-#
-#         return JSONResponse(status_code=200, content={
-#             "answer": result['result'],
-#             "source_documents": serialized_docs
-#         })
-#
-#     except Exception as e:
-#         print(f"Error in simple_document_chat: {str(e)}")
-#         raise ValueError(f"Failed to execute document chat: {str(e)}")
-
 
 def save_message(conversation_id: int, role: str, content: JSON, db: DB):
+    return save_messages(conversation_id, [(role, content)], db)[0]
+
+
+def save_messages(conversation_id: int, items: List[Tuple[str, JSON]], db: DB) -> List[dict]:
+    """
+    Save several messages of a conversation in one INSERT and one commit.
+
+    Args:
+        conversation_id: ID of the conversation the messages belong to
+        items: (role, content) pairs in the order they should be saved
+        db: Database the messages are saved to
+
+    Returns:
+        The id and role of each saved message, in the order of `items`
+    """
     try:
         with db.session() as session:
-            # Create DataSources entry
-            new_data_source = Messages(
-                conversation_id=conversation_id,
-                role=role,
-                content=content,
-            )
-
-            session.add(new_data_source)
+            # Single INSERT ... RETURNING instead of add/commit/refresh per message
+            saved = session.execute(_INSERT_MESSAGE, [
+                {"conversation_id": conversation_id, "role": role, "content": content}
+                for role, content in items
+            ]).all()
             session.commit()
-            session.refresh(new_data_source)
 
-        return {
-            "id": new_data_source.id,
-            "role": new_data_source.role
-        }
+        # Later history reads then find these messages already converted
+        _cache_history(conversation_id, {
+            row.id: _history_entry(role, content) for row, (role, content) in zip(saved, items)
+        }, replace=False)
+
+        return [{
+            "id": row.id,
+            "role": row.role
+        } for row in saved]
 
     except SQLAlchemyError as e:
-        logger.error(f"Database error: {str(e)}")
+        logger.error("Database error: %s", e)
         raise HTTPException(status_code=500, detail={
             "message": "Database error occurred",
             "error": str(e)
         })
     except Exception as e:
         # Catch all other errors and raise HTTP exception
-        logger.error(f"Something went wrong: {str(e)}")
+        logger.error("Something went wrong: %s", e)
         raise HTTPException(status_code=500, detail={
             "message": "Database error occurred",
             "error": str(e)
-        })
\ No newline at end of file
+        })
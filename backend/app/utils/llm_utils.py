@@ -0,0 +1,135 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps
+
+from app.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def model_id(llm: Any) -> str:
+    """Return the model name a LangChain client was built for."""
+    return getattr(llm, 'model_name', None) or getattr(llm, 'model', None) or type(llm).__name__
+
+
+class LoopLocalTransport(httpx.AsyncBaseTransport):
+    """
+    Async transport keeping one connection pool per event loop.
+
+    Pooled connections are bound to the loop that opened them, so a single
+    long-lived AsyncClient can't be reused once that loop closes (e.g. across
+    asyncio.run calls). This transport hands each running loop its own pool,
+    created on first use, so the shared client and its keep-alive HTTP/2
+    connections survive loop changes. Pools of closed loops are closed and
+    discarded when a new loop shows up.
+    """
+
+    def __init__(self, factory: Callable[[], httpx.AsyncBaseTransport]):
+        self._factory = factory
+        self._transports: Dict[asyncio.AbstractEventLoop, httpx.AsyncBaseTransport] = {}
+        self._lock = Lock()
+
+    def _transport(self) -> Tuple[httpx.AsyncBaseTransport, List[httpx.AsyncBaseTransport]]:
+        """Return the running loop's transport and the evicted transports of closed loops."""
+        loop = asyncio.get_running_loop()
+        stale = []
+        with self._lock:
+            transport = self._transports.get(loop)
+            if transport is None:
+                for closed in [other for other in self._transports if other.is_closed()]:
+                    stale.append(self._transports.pop(closed))
+                transport = self._transports[loop] = self._factory()
+            return transport, stale
+
+    @staticmethod
+    async def _close(transports: List[httpx.AsyncBaseTransport]) -> None:
+        # Best-effort: connections of a closed loop may fail to shut down cleanly
+        for transport in transports:
+            try:
+                await transport.aclose()
+            except Exception as e:
+                logger.debug("Error closing HTTP transport: %s", e)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        transport, stale = self._transport()
+        await self._close(stale)
+        return await transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        # Shutdown closes the pools of every loop, not only the current one
+        with self._lock:
+            transports = list(self._transports.values())
+            self._transports.clear()
+        await self._close(transports)
+
+
+class ResponseCache(BaseCache):
+    """
+    In-memory LRU cache of LLM responses keyed on (model, prompt).
+
+    Prompts are hashed exactly as sent with sha256, entries expire
+    after `ttl` seconds and the least recently used entry is evicted once
+    `maxsize` entries are stored. Also implements LangChain's BaseCache so it
+    can be passed as a client's `cache` and cover every chain using it.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def make_key(model_name: str, prompt: Any) -> str:
+        # Message lists are serialized whole, so roles and boundaries are part of the key
+        text = prompt if isinstance(prompt, str) else dumps(prompt)
+        return hashlib.sha256(f"{model_name}\x00{text}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            response, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: Any) -> None:
+        with self._lock:
+            self._entries[key] = (response, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        return self.get(self.make_key(llm_string, prompt))
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        self.set(self.make_key(llm_string, prompt), return_val)
+
+    # In-memory, so the async variants don't need an executor hop
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        return self.lookup(prompt, llm_string)
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        self.update(prompt, llm_string, return_val)
+
+    async def aclear(self, **kwargs: Any) -> None:
+        self.clear()
+
+
+response_cache = ResponseCache()
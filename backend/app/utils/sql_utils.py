@@ -0,0 +1,337 @@
+import hashlib
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+import sqlglot
+from sqlglot import exp
+from sqlglot.dialects.postgres import Postgres
+from sqlglot.errors import SqlglotError
+from sqlglot.tokens import TokenType
+
+from app.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Queries run on Postgres; the SQL prompts' examples quote identifiers with
+# backticks, which clean_sql_query strips before execution
+SQL_DIALECT = "postgres"
+
+MISSING_VALUE_MARKERS = ("", "N/A")
+_TEXT_TYPE_HINTS = ("CHAR", "TEXT", "STRING", "CLOB")
+
+# schema fingerprint -> (table names, column names), lower-cased
+_SCHEMA_INDEX_MAXSIZE = 64
+_schema_indexes: "OrderedDict[str, Tuple[frozenset, frozenset]]" = OrderedDict()
+_schema_indexes_lock = Lock()
+
+
+class _BacktickPostgres(Postgres):
+    """Postgres, also reading and writing backtick-quoted identifiers."""
+
+    class Tokenizer(Postgres.Tokenizer):
+        IDENTIFIERS = ["`", '"']
+
+
+def _dialect(sql: str):
+    return _BacktickPostgres if "`" in sql else SQL_DIALECT
+
+
+def _tokens(sql: str, dialect) -> List[Tuple[str, str]]:
+    """Tokenize a query, ignoring keyword case, spacing, optional ASes and trailing semicolons."""
+    tokens = [
+        (token.token_type.name,
+         token.text if token.token_type in (TokenType.STRING, TokenType.IDENTIFIER) else token.text.upper())
+        for token in sqlglot.tokenize(sql, read=dialect)
+        if token.token_type != TokenType.ALIAS
+    ]
+    while tokens and tokens[-1][0] == TokenType.SEMICOLON.name:
+        tokens.pop()
+    return tokens
+
+
+def _is_text_type(column_type: str) -> bool:
+    return any(hint in column_type.upper() for hint in _TEXT_TYPE_HINTS)
+
+
+def _column_types(schema: List[Dict]) -> Dict[str, Dict[str, str]]:
+    """Map lower-cased table name -> lower-cased column name -> column type."""
+    return {
+        table["table_name"].lower(): {
+            column["name"].lower(): str(column.get("type", ""))
+            for column in table.get("schema", [])
+        }
+        for table in schema or []
+    }
+
+
+def _source_tables(select: exp.Select) -> Dict[str, Optional[str]]:
+    """Map the alias (or name) of each FROM/JOIN source to its table, or None for subqueries."""
+    from_ = next(arg for arg in select.args.values() if isinstance(arg, exp.From))
+    sources = {}
+    for source in [from_.this] + [join.this for join in select.args.get("joins") or []]:
+        table = source.name.lower() if isinstance(source, exp.Table) else None
+        sources[source.alias_or_name.lower()] = table
+    return sources
+
+
+def _column_type(column: exp.Column, sources: Dict[str, Optional[str]],
+                 column_types: Dict[str, Dict[str, str]]) -> Optional[str]:
+    """
+    Resolve a column's type through its table or alias.
+
+    Unqualified columns are looked up in every source table. Returns None
+    when the column can't be pinned to exactly one type, e.g. it comes from
+    a subquery or CTE, or same-named columns of joined tables differ in type.
+    """
+    if column.table:
+        tables = [sources.get(column.table.lower())]
+    else:
+        tables = list(sources.values())
+    if None in tables:
+        return None
+    found = {column_types[table][column.name.lower()]
+             for table in tables if column.name.lower() in column_types.get(table, {})}
+    return found.pop() if len(found) == 1 else None
+
+
+def add_missing_value_filters(sql: str, schema: List[Dict]) -> str:
+    """
+    Skip rows where a selected non-aggregate column is missing.
+
+    Every plain column in the projection gets an `IS NOT NULL` filter; text
+    columns (typed through the column's own table) additionally exclude ''
+    and 'N/A'. Columns the WHERE clause already references are left alone,
+    so questions about missing values keep their rows. Queries that can't be
+    parsed, aren't a single SELECT, select no plain columns, or that sqlglot
+    wouldn't reproduce token for token (e.g. it rewrites now() or an
+    INTERVAL literal) are returned as-is.
+
+    Args:
+        sql: SQL query generated by the LLM
+        schema: Schema as returned by DB.get_schemas
+
+    Returns:
+        The query with the filters ANDed into its WHERE clause
+    """
+    dialect = _dialect(sql)
+    try:
+        tree = sqlglot.parse_one(sql, read=dialect)
+        if not isinstance(tree, exp.Select) or not any(isinstance(arg, exp.From) for arg in tree.args.values()):
+            return sql
+        if _tokens(tree.sql(dialect=dialect), dialect) != _tokens(sql, dialect):
+            logger.debug("Not adding filters, SQL doesn't round-trip: %s", sql)
+            return sql
+    except SqlglotError as e:
+        logger.warning("Could not parse SQL to add filters: %s", e)
+        return sql
+
+    where = tree.args.get("where")
+    constrained = {column.name.lower() for column in where.find_all(exp.Column)} if where else set()
+    sources = _source_tables(tree)
+    column_types = _column_types(schema)
+    conditions = []
+    seen = set()
+    for projection in tree.expressions:
+        column = projection.unalias()
+        if not isinstance(column, exp.Column) or isinstance(column.this, exp.Star):
+            continue
+        key = column.sql(dialect=dialect)
+        if key in seen or column.name.lower() in constrained:
+            continue
+        seen.add(key)
+
+        condition = exp.Not(this=exp.Is(this=column.copy(), expression=exp.Null()))
+        column_type = _column_type(column, sources, column_types)
+        if column_type is not None and _is_text_type(column_type):
+            markers = [exp.Literal.string(marker) for marker in MISSING_VALUE_MARKERS]
+            condition = exp.and_(condition, exp.Not(this=exp.In(this=column.copy(), expressions=markers)))
+        conditions.append(condition)
+
+    if not conditions:
+        return sql
+    return tree.where(*conditions, append=True, copy=False).sql(dialect=dialect)
+
+
+def schema_fingerprint(schema: List[Dict]) -> str:
+    """
+    Fingerprint a schema and index its table and column names.
+
+    Args:
+        schema: Schema as returned by DB.get_schemas
+
+    Returns:
+        Short blake2b hex digest identifying the schema
+    """
+    fingerprint = hashlib.blake2b(str(schema).encode(), digest_size=8).hexdigest()
+    with _schema_indexes_lock:
+        if fingerprint in _schema_indexes:
+            _schema_indexes.move_to_end(fingerprint)
+            return fingerprint
+        tables = frozenset(table["table_name"].lower() for table in schema or [])
+        columns = frozenset(
+            column["name"].lower()
+            for table in schema or []
+            for column in table.get("schema", [])
+        )
+        _schema_indexes[fingerprint] = (tables, columns)
+        while len(_schema_indexes) > _SCHEMA_INDEX_MAXSIZE:
+            _schema_indexes.popitem(last=False)
+    return fingerprint
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_sql(sql: str, fingerprint: str) -> bool:
+    with _schema_indexes_lock:
+        index = _schema_indexes.get(fingerprint)
+    if index is None:
+        return False
+    tables, columns = index
+
+    try:
+        tree = sqlglot.parse_one(sql, read=_dialect(sql))
+    except SqlglotError:
+        return False
+    if not isinstance(tree, exp.Query):
+        return False
+
+    cte_names = {cte.alias_or_name.lower() for cte in tree.find_all(exp.CTE)}
+    aliases = {alias.alias.lower() for alias in tree.find_all(exp.Alias)}
+
+    for table in tree.find_all(exp.Table):
+        if table.name.lower() not in tables and table.name.lower() not in cte_names:
+            return False
+    for column in tree.find_all(exp.Column):
+        if isinstance(column.this, exp.Star):
+            continue
+        name = column.name.lower()
+        if name not in columns and name not in aliases:
+            return False
+    return True
+
+
+def is_valid_sql(sql: str, schema: List[Dict]) -> bool:
+    """
+    Check locally that a query parses and only references known tables and columns.
+
+    Results are memoized per (query, schema fingerprint). A False result only
+    means the query couldn't be verified, not that it is wrong.
+
+    Args:
+        sql: SQL query to validate
+        schema: Schema as returned by DB.get_schemas
+
+    Returns:
+        True if the query parses and every identifier exists in the schema
+    """
+    return _is_valid_sql(sql, schema_fingerprint(schema))
+
+
+def relevant_table_names(parsed_question: Dict) -> List[str]:
+    """Return the table names flagged by the schema-insights step."""
+    if not isinstance(parsed_question, dict):
+        return []
+    return [
+        table["table_name"]
+        for table in parsed_question.get("relevant_tables") or []
+        if isinstance(table, dict) and table.get("table_name")
+    ]
+
+
+def filter_schema(schema: List[Dict], relevant_tables: List[str]) -> List[Dict]:
+    """
+    Keep only the tables flagged as relevant to the question.
+
+    Falls back to the full schema when nothing matches, so a bad table list
+    never leaves the SQL prompts without a schema.
+
+    Args:
+        schema: Schema as returned by DB.get_schemas
+        relevant_tables: Table names from the schema-insights step
+
+    Returns:
+        The matching subset of `schema`
+    """
+    wanted = {name.lower() for name in relevant_tables}
+    filtered = [table for table in schema or [] if table["table_name"].lower() in wanted]
+    return filtered or schema
+
+
+# Text columns that identify rows or hold free text rather than a small set of
+# names/labels; the schema carries no cardinality, so names are the best proxy
+_NON_NOUN_COLUMN = re.compile(
+    r"(^|_)(id|uuid|guid|key|hash|token|description|desc|comments?|notes?|text|body|message|url|email|address|path)$",
+    re.IGNORECASE)
+# Questions about the dataset as a whole need the LLM to pick tables and columns
+_GENERIC_QUESTION = re.compile(
+    r"\b(summari[sz]e|summary|overview|analy[sz]e|describe|explain|insights?|what is in|show me)\b",
+    re.IGNORECASE)
+# Upload suffixes such as "_a0634235" are not part of the name users type
+_TABLE_SUFFIX = re.compile(r"_[0-9a-f]{6,}$", re.IGNORECASE)
+MAX_DETERMINISTIC_TABLES = 3
+
+
+def is_noun_column(name: str, column_type: str) -> bool:
+    """Whether a column likely holds names/labels: text-typed, and not an identifier or free text."""
+    return _is_text_type(column_type) and not _NON_NOUN_COLUMN.search(name)
+
+
+@lru_cache(maxsize=1024)
+def _table_name_pattern(name: str) -> "re.Pattern[str]":
+    # Whole words only; underscores in a name may be typed as spaces
+    words = [re.escape(word) for word in re.split(r"[_\s]+", name) if word]
+    return re.compile(r"\b" + r"[_\s]+".join(words) + r"\b", re.IGNORECASE)
+
+
+def match_schema_insights(question: str, schema: List[Dict]) -> Optional[Dict]:
+    """
+    Resolve the schema-insights step without the LLM when the question names its tables.
+
+    Table names (and their names without an upload suffix) are matched as
+    whole words in the question, so "order" doesn't match "orders". If one to
+    MAX_DETERMINISTIC_TABLES tables match, no words name more than one table
+    and the question isn't a generic "summarize this" request, the result is
+    built directly from the schema.
+
+    Args:
+        question: The user's question
+        schema: Schema as returned by DB.get_schemas
+
+    Returns:
+        parsed_question in the schema-insights format, or None if the LLM is needed
+    """
+    if not schema or _GENERIC_QUESTION.search(question):
+        return None
+
+    # (start, end, table index) of every table name found in the question
+    spans = []
+    for index, table in enumerate(schema):
+        for name in {table["table_name"], _TABLE_SUFFIX.sub("", table["table_name"])}:
+            spans.extend((*match.span(), index) for match in _table_name_pattern(name).finditer(question))
+    # Overlapping names must all belong to one table
+    cluster_end, owners = -1, set()
+    for start, end, index in sorted(spans):
+        if start >= cluster_end:
+            owners = set()
+        owners.add(index)
+        if len(owners) > 1:
+            return None
+        cluster_end = max(cluster_end, end)
+
+    matched = sorted({index for _, _, index in spans})
+    if not matched or len(matched) > MAX_DETERMINISTIC_TABLES:
+        return None
+
+    relevant_tables = []
+    for index in matched:
+        table = schema[index]
+        columns = table.get("schema", [])
+        relevant_tables.append({
+            "table_name": table["table_name"],
+            "columns": [column["name"] for column in columns],
+            "noun_columns": [column["name"] for column in columns
+                             if is_noun_column(column["name"], str(column.get("type", "")))],
+        })
+    return {"is_relevant": True, "relevant_tables": relevant_tables}
@@ -4,6 +4,7 @@ from app.api import api_router
 from app.api.middleware.auth_middleware import AuthMiddleware
 from app.api.db.models import init_db
 from app.dependencies.database import get_db
+from app.config.llm_config import close_http_clients
 
 app = FastAPI()
 
@@ -23,6 +24,11 @@ async def startup_event():
     init_db()
     db = next(get_db())
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    # Close keep-alive connections to the LLM providers
+    await close_http_clients()
+
 # Include API routes
 app.include_router(api_router)
 
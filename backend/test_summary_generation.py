@@ -60,21 +60,22 @@ async def test_all_models_summarization():
         "failed": []
     }
 
-    for model_name in models:
-        print(f"\n{'=' * 80}")
-        print(f"Testing: {model_name}")
-        print(f"Display Name: {AVAILABLE_MODELS[model_name].display_name}")
-        print(f"Platform: {AVAILABLE_MODELS[model_name].platform.value}")
-        print(f"Capability: {AVAILABLE_MODELS[model_name].capability.value}")
-        print(f"{'=' * 80}")
+    async def run_model(model_name):
+        """Summarize with one model; returns (passed, report lines)."""
+        report = [
+            f"\n{'=' * 80}",
+            f"Testing: {model_name}",
+            f"Display Name: {AVAILABLE_MODELS[model_name].display_name}",
+            f"Platform: {AVAILABLE_MODELS[model_name].platform}",
+            f"Capability: {AVAILABLE_MODELS[model_name].capability.value}",
+            f"{'=' * 80}",
+        ]
 
         try:
-            # Initialize LLM instance
-            llm_instance = LLM()
             llm = llm_instance.get_model(model_name, fallback=False)
 
             # Invoke the model
-            response = llm.invoke(prompt)
+            response = await llm.ainvoke(prompt)
 
             # Extract response text
             if hasattr(response, 'content'):
@@ -86,25 +87,38 @@ async def test_all_models_summarization():
             word_count = len(response_text.split())
             paragraph_count = len([p for p in response_text.split('\n\n') if p.strip()])
 
-            print(f"\n✅ {model_name} SUCCESS")
-            print(f"   Response Length: {len(response_text)} characters")
-            print(f"   Word Count: {word_count} words")
-            print(f"   Paragraph Count: {paragraph_count}")
-            print(f"\n   Sample Output (first 200 chars):")
-            print(f"   {response_text[:200]}...")
+            report += [
+                f"\n✅ {model_name} SUCCESS",
+                f"   Response Length: {len(response_text)} characters",
+                f"   Word Count: {word_count} words",
+                f"   Paragraph Count: {paragraph_count}",
+                f"\n   Sample Output (first 200 chars):",
+                f"   {response_text[:200]}...",
+            ]
 
             # Check if response is comprehensive (not just one sentence)
             if word_count >= 30 and len(response_text) >= 150:
-                results["passed"].append(model_name)
-                print(f"\n   ✓ Summary is comprehensive")
-            else:
-                results["failed"].append(model_name)
-                print(f"\n   ✗ WARNING: Summary may be too short")
+                report.append(f"\n   ✓ Summary is comprehensive")
+                return True, report
+            report.append(f"\n   ✗ WARNING: Summary may be too short")
+            return False, report
 
         except Exception as e:
-            print(f"\n❌ {model_name} FAILED")
-            print(f"   Error: {str(e)}")
-            results["failed"].append(model_name)
+            report += [
+                f"\n❌ {model_name} FAILED",
+                f"   Error: {str(e)}",
+            ]
+            return False, report
+
+    # Initialize LLM instance
+    llm_instance = LLM()
+
+    # Query every model concurrently so the run takes as long as the slowest
+    # model, then print the reports in model order
+    outcomes = await asyncio.gather(*(run_model(model_name) for model_name in models))
+    for model_name, (passed, report) in zip(models, outcomes):
+        print("\n".join(report))
+        results["passed" if passed else "failed"].append(model_name)
 
     # Print summary
     print(f"\n\n{'=' * 80}")
@@ -176,8 +190,8 @@ async def test_fallback_mechanism():
 
         response = llm.invoke("Hello, can you summarize data?")
         print(f"✅ Fallback mechanism works!")
-        print(f"   Fell back to model: {llm_instance.current_model}")
-        print(f"   Platform: {llm_instance.platform}")
+        print(f"   Fell back to model: {llm.model_name}")
+        print(f"   Platform: {AVAILABLE_MODELS[llm.model_name].platform}")
     except Exception as e:
         print(f"❌ Fallback mechanism failed: {str(e)}")
 
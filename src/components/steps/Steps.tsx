@@ -21,6 +21,9 @@ const Steps: React.FC<StepsProps> = ({ processingMessages, isProcessing }) => {
           if(message?.query_result) return 
           if(message?.formatted_data_for_visualization) return 
           if(message?.answer) return 
+          // Answer tokens are rendered in the chat pane as they arrive
+          if(message?.delta !== undefined) return 
+          if(message?.done) return 
 
           return (
             <div
@@ -29,7 +32,12 @@ const Steps: React.FC<StepsProps> = ({ processingMessages, isProcessing }) => {
             >
               {
                 message?.parsed_question ?
-                 <RelevantTables parsed_question={message?.parsed_question}/>
+                <div>
+                  <RelevantTables parsed_question={message?.parsed_question}/>
+                  {/* The unified SQL step returns the query alongside the tables */}
+                  {message?.sql_query && message.sql_query !== "NOT_RELEVANT" &&
+                    <SQLCode sqlCode={message.sql_query}/>}
+                </div>
                 :
                 (!('sql_valid' in message) && ("sql_query" in message))?
                 <div>
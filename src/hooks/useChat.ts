@@ -67,9 +67,9 @@ export const useGetConversationHistoryMutation = (options?: ConversationMessageH
         if(message?.content?.question){
           conversationHistory.push({question: message.content.question})
         }else{
+          // Older messages store each step as a JSON string
           const answer = message.content.answer?.map((data:any)=>{
-             const parsedString = JSON.parse(data)
-             return parsedString
+             return typeof data === "string" ? JSON.parse(data) : data
           })
           conversationHistory.push({answer})
         }
@@ -41,6 +41,8 @@ export interface ProcessingMessage {
   sql_valid?: boolean;
   query_result?: string;
   answer?: string;
+  delta?: string;
+  done?: boolean;
   recommended_visualization?: string;
   reason?: string;
   formatted_data_for_visualization?: FormattedData[];
@@ -51,7 +53,9 @@ export interface ProcessingMessage {
 export interface AiAnswer{
   answer?: string,
   formatted_data_for_visualization?: object[],
-  recommended_visualization?: string
+  recommended_visualization?: string,
+  // The answer was already shown token by token while streaming
+  streamed?: boolean
 }
 export interface ConversationMessages{
   user_question?: string,
@@ -9,6 +9,7 @@ import { useParams } from 'react-router-dom';
 import { useStreamChat } from '../hooks/useChat';
 import { ConversationMessages, ProcessingMessage } from '../interfaces/chatInterface';
 import TypewriterWithHighlight from '../components/TypewriterWithHighlight';
+import HighlightText from '../components/steps/HighlightText';
 import ChartComponent from '../components/ChartComponent';
 // import { toast } from 'react-toastify';
 import dataSetStore from '../zustand/stores/dataSetStore';
@@ -43,6 +44,9 @@ export default function Chat() {
         if(message.answer){
           ai_answer["answer"] = message.answer
         }
+        if(message.delta !== undefined){
+          ai_answer["streamed"] = true
+        }
         if(message.formatted_data_for_visualization){
           ai_answer["formatted_data_for_visualization"] = message.formatted_data_for_visualization
         }
@@ -97,6 +101,11 @@ export default function Chat() {
     })
   };
 
+  // Answer tokens received so far, shown until the final answer arrives
+  const streamingAnswer = status === "pending"
+    ? processingMessages.map((message) => message?.delta ?? "").join("")
+    : "";
+
   console.log(selectedModel);
   console.log("TABLES",tables);
 
@@ -151,7 +160,10 @@ export default function Chat() {
                       <div className="flex items-start mb-4">
                         <BsStars className="text-3xl text-navy-600 mr-2 flex-shrink-0" />
                         <div className="flex-1">
-                          <TypewriterWithHighlight text={message.ai_answer.answer || ""} />
+                          {message.ai_answer.streamed ?
+                            <HighlightText text={message.ai_answer.answer || ""} />
+                            :
+                            <TypewriterWithHighlight text={message.ai_answer.answer || ""} />}
                         </div>
                       </div>
 
@@ -224,6 +236,18 @@ export default function Chat() {
             ) : (
               <SelectDataset />
             )}
+
+            {/* AI reply being streamed */}
+            {streamingAnswer && (
+              <div className="mb-6 bg-blue-gray-50 rounded-lg p-4">
+                <div className="flex items-start">
+                  <BsStars className="text-3xl text-navy-600 mr-2 flex-shrink-0" />
+                  <div className="flex-1">
+                    <HighlightText text={streamingAnswer} />
+                  </div>
+                </div>
+              </div>
+            )}
           </div>
           {/* textarea div */}
           <div className="mt-auto flex justify-center items-center">
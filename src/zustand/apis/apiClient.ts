@@ -79,7 +79,7 @@ export const postStream = async <T>(
   const streamConfig: AxiosRequestConfig = {
     headers: {
       Authorization: `Bearer ${user?.access_token}`,
-      "Accept": "text/event-stream",
+      "Accept": "application/x-ndjson",
       "Cache-Control": "no-cache",
     },
     responseType: 'stream',